@@ -1,23 +1,36 @@
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional, List
 
 class Settings(BaseSettings):
+    # Deployment profile: "development" keeps docs and debug conveniences,
+    # "production" strips them
+    ENV: str = "development"
+
     # MT5 Settings
     MT5_LOGIN: int
     MT5_PASSWORD: str
     MT5_SERVER: str
-    
+
     # Notification Settings
     TELEGRAM_BOT_TOKEN: str
     TELEGRAM_CHAT_ID: str
     DISCORD_WEBHOOK_URL: str
-    
+
     # MongoDB settings
     MONGODB_URL: str
     MONGODB_DB: str
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        extra="ignore",
+        frozen=True,
+    )
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build Settings once; reuse across reload workers and tests."""
+    return Settings()
 
-settings = Settings() 
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
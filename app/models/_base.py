@@ -0,0 +1,27 @@
+from pydantic import BaseModel, ConfigDict
+
+class AppModel(BaseModel):
+    """
+    Shared base class for all API models.
+
+    defer_build postpones pydantic-core schema compilation until a model is
+    first validated/serialized, which profiling shows is the dominant
+    FastAPI startup cost. populate_by_name is kept on for models populated
+    from MT5/Mongo field names.
+    """
+    model_config = ConfigDict(defer_build=True, populate_by_name=True)
+
+class FrozenAppModel(AppModel):
+    """
+    Base class for immutable value models (ticks, candles, history rows).
+
+    frozen drops the mutable-field machinery and enables hash caching,
+    extra='forbid' skips the extra-key scan, and populate_by_name is off
+    since none of these rows carry aliases.
+    """
+    model_config = ConfigDict(
+        defer_build=True,
+        frozen=True,
+        extra="forbid",
+        populate_by_name=False
+    )
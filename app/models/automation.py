@@ -1,8 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import List, Optional, Dict, Union
 from decimal import Decimal
 from datetime import datetime, time
 from enum import Enum
+from ._base import AppModel
 
 class ScheduleType(str, Enum):
     ONCE = "once"          # Execute trade once
@@ -26,13 +27,13 @@ class MartingaleType(str, Enum):
     ANTI = "anti"             # Double position size after win
     FIBONACCI = "fibonacci"    # Use Fibonacci sequence for sizing
 
-class TradeCondition(BaseModel):
+class TradeCondition(AppModel):
     type: ConditionType
     operator: str = Field(..., description=">, <, =, >=, <=")
     value: Union[float, str]
     indicator_params: Optional[Dict] = None
 
-class ScheduledTrade(BaseModel):
+class ScheduledTrade(AppModel):
     symbol: str
     schedule_type: ScheduleType
     execution_time: time
@@ -44,7 +45,7 @@ class ScheduledTrade(BaseModel):
     expiry_date: Optional[datetime]
     max_trades: Optional[int]
 
-class ConditionalOrder(BaseModel):
+class ConditionalOrder(AppModel):
     symbol: str
     conditions: List[TradeCondition]
     order_type: str
@@ -53,7 +54,7 @@ class ConditionalOrder(BaseModel):
     take_profit: Optional[Decimal]
     expiry: Optional[datetime]
 
-class GridTradingConfig(BaseModel):
+class GridTradingConfig(AppModel):
     symbol: str
     grid_type: GridType
     start_price: Decimal
@@ -64,11 +65,11 @@ class GridTradingConfig(BaseModel):
     stop_loss_pips: Optional[int]
     max_positions: Optional[int]
 
-class MartingaleConfig(BaseModel):
+class MartingaleConfig(AppModel):
     symbol: str
     martingale_type: MartingaleType
-    initial_volume: Decimal
-    multiplier: Decimal = Field(2.0, description="Volume multiplier after loss/win")
-    max_volume: Optional[Decimal]
+    initial_volume: float
+    multiplier: float = Field(2.0, description="Volume multiplier after loss/win")
+    max_volume: Optional[float]
     max_trades: Optional[int]
     reset_on_win: bool = True 
\ No newline at end of file
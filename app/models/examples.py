@@ -0,0 +1,30 @@
+"""
+Static OpenAPI request examples for the docs.
+
+Kept out of the model classes so pydantic's core-schema build does not
+carry example metadata on request-body models instantiated per call;
+routers attach these via Body(..., examples=[...]).
+"""
+
+TRADE_REQUEST_EXAMPLE = {
+    "symbol": "BTCUSDm",
+    "order_type": "BUY",
+    "amount": 1000,
+    "stop_loss": 1.0800,
+    "take_profit": 1.0900,
+    "comment": "Python trading bot order"
+}
+
+MODIFY_POSITION_EXAMPLE = {
+    "stop_loss": 1.0800,
+    "take_profit": 1.0900
+}
+
+TRADING_SIGNAL_EXAMPLE = {
+    "_id": "67763f3f90a1c1a9b9bb8851",
+    "symbol": "BTCUSDT",
+    "signal_type": "UP",
+    "timeframe": "S",
+    "entry_price": 0.0,
+    "created_at": "2025-01-02T14:21:12.172Z"
+}
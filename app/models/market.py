@@ -1,37 +1,36 @@
-from pydantic import BaseModel
 from typing import List
 from datetime import datetime
-from decimal import Decimal
+from ._base import AppModel, FrozenAppModel
 
-class SymbolInfo(BaseModel):
+class SymbolInfo(AppModel):
     name: str
-    bid: Decimal
-    ask: Decimal
+    bid: float
+    ask: float
     spread: int
     digits: int
     trade_mode: str
     trade_allowed: bool
-    volume_min: Decimal
-    volume_max: Decimal
-    volume_step: Decimal
+    volume_min: float
+    volume_max: float
+    volume_step: float
 
-class TickData(BaseModel):
+class TickData(FrozenAppModel):
     time: datetime
-    bid: Decimal
-    ask: Decimal
-    last: Decimal
-    volume: Decimal
+    bid: float
+    ask: float
+    last: float
+    volume: float
 
-class OHLC(BaseModel):
+class OHLC(FrozenAppModel):
     time: datetime
-    open: Decimal
-    high: Decimal
-    low: Decimal
-    close: Decimal
-    volume: Decimal
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
 
 # New models for symbol search
-class SearchSymbolInfo(BaseModel):
+class SearchSymbolInfo(AppModel):
     name: str
     description: str
     base_currency: str
@@ -48,5 +47,5 @@ class SearchSymbolInfo(BaseModel):
     ask: float
     spread: float
 
-class SymbolList(BaseModel):
+class SymbolList(AppModel):
     symbols: List[SearchSymbolInfo]
\ No newline at end of file
@@ -1,8 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import Optional, List
 from decimal import Decimal
 from datetime import datetime
 from enum import Enum
+from ._base import AppModel
 
 class NotificationChannel(str, Enum):
     TELEGRAM = "telegram"
@@ -20,19 +21,19 @@ class AlertType(str, Enum):
     NEWS = "news"     # Tin tức thị trường
     PRICE = "price"   # Biến động giá
 
-class PriceAlert(BaseModel):
+class PriceAlert(AppModel):
     symbol: str
     condition: str = Field(..., description="above/below/cross")
     price_level: Decimal
     channels: List[NotificationChannel]
     
-class PnLAlert(BaseModel):
+class PnLAlert(AppModel):
     position_id: Optional[int] = None  # None = toàn bộ portfolio
     profit_threshold: Optional[Decimal] = None
     loss_threshold: Optional[Decimal] = None
     channels: List[NotificationChannel]
 
-class SignalAlert(BaseModel):
+class SignalAlert(AppModel):
     symbol: str
     signal_type: str  # buy/sell/close
     entry_price: Decimal
@@ -41,12 +42,12 @@ class SignalAlert(BaseModel):
     confidence: Optional[float]
     channels: List[NotificationChannel]
 
-class NewsAlert(BaseModel):
+class NewsAlert(AppModel):
     symbols: List[str]
     importance: List[str] = ["high", "medium", "low"]
     channels: List[NotificationChannel]
 
-class NotificationConfig(BaseModel):
+class NotificationConfig(AppModel):
     telegram_token: Optional[str]
     telegram_chat_id: Optional[str]
     discord_webhook: Optional[str]
\ No newline at end of file
@@ -1,8 +1,8 @@
-from pydantic import BaseModel
 from typing import List, Dict, Optional
 from datetime import datetime
+from ._base import AppModel
 
-class TradeStats(BaseModel):
+class TradeStats(AppModel):
     total_trades: int
     winning_trades: int
     losing_trades: int
@@ -13,7 +13,7 @@ class TradeStats(BaseModel):
     start_date: datetime
     end_date: datetime
 
-class PairAnalysis(BaseModel):
+class PairAnalysis(AppModel):
     symbol: str
     total_profit: float
     total_trades: int
@@ -22,14 +22,14 @@ class PairAnalysis(BaseModel):
     best_trading_hours: List[int]
     risk_score: float
 
-class DrawdownInfo(BaseModel):
+class DrawdownInfo(AppModel):
     current_drawdown: float
     max_drawdown: float
     drawdown_periods: List[Dict[str, datetime]]
     recovery_time: Optional[int]
     risk_level: str
 
-class PeriodicReport(BaseModel):
+class PeriodicReport(AppModel):
     period: str
     start_date: datetime
     end_date: datetime
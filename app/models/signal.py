@@ -1,7 +1,8 @@
-from pydantic import BaseModel, Field
+from pydantic import Field, ConfigDict
 from datetime import datetime
 from enum import Enum
 from typing import Optional
+from ._base import AppModel
 
 class SignalType(str, Enum):
     UP = "UP"
@@ -29,7 +30,38 @@ class TimeFrame(str, Enum):
     Q1 = "3M"     # 1 quarter (3 months)
     Y1 = "12M"    # 1 year
 
-class TradingSignal(BaseModel):
+# Value-to-member maps for hot dispatch paths: a plain dict hit instead of
+# the Enum __call__ machinery (which scans members on miss)
+SIGNAL_TYPE_BY_VALUE: dict[str, SignalType] = {m.value: m for m in SignalType}
+TIMEFRAME_BY_VALUE: dict[str, TimeFrame] = {m.value: m for m in TimeFrame}
+
+# Timeframe duration in seconds; one dict hit instead of parsing the enum
+# value wherever dispatch code needs the bar length (months use calendar
+# approximations: 30/90/365 days)
+TIMEFRAME_SECONDS: dict[TimeFrame, int] = {
+    TimeFrame.S1: 1,
+    TimeFrame.S5: 5,
+    TimeFrame.S15: 15,
+    TimeFrame.S30: 30,
+    TimeFrame.M1: 60,
+    TimeFrame.M3: 180,
+    TimeFrame.M5: 300,
+    TimeFrame.M15: 900,
+    TimeFrame.M30: 1800,
+    TimeFrame.M45: 2700,
+    TimeFrame.H1: 3600,
+    TimeFrame.H2: 7200,
+    TimeFrame.H3: 10800,
+    TimeFrame.H4: 14400,
+    TimeFrame.D1: 86400,
+    TimeFrame.D5: 432000,
+    TimeFrame.W1: 604800,
+    TimeFrame.MN1: 2592000,
+    TimeFrame.Q1: 7776000,
+    TimeFrame.Y1: 31536000,
+}
+
+class TradingSignal(AppModel):
     _id: Optional[str] = None
     symbol: str = Field(..., description="Trading symbol (e.g. BTCUSDT)")
     signal_type: SignalType = Field(..., description="Signal type: UP or DOWN")
@@ -37,25 +69,20 @@ class TradingSignal(BaseModel):
     entry_price: float = Field(..., description="Entry price for the signal")
     created_at: datetime = Field(default_factory=datetime.now, description="Signal creation timestamp")
 
-    class Config:
-        populate_by_name = True
-        json_schema_extra = {
-            "example": {
-                "_id": "67763f3f90a1c1a9b9bb8851",
-                "symbol": "BTCUSDT",
-                "signal_type": "UP",
-                "timeframe": "S",
-                "entry_price": 0.0,
-                "created_at": "2025-01-02T14:21:12.172Z"
-            }
-        } 
-
-class TimeframeSignal(BaseModel):
-    timeframe: str
-    signal_type: Optional[SignalType] = None
-    entry_price: float
-
-class SymbolSignalsResponse(BaseModel):
+    # Request example lives in app.models.examples; keeping it off the
+    # class keeps example metadata out of the core-schema build
+    model_config = ConfigDict(defer_build=True, populate_by_name=True)
+
+class SymbolSignalsResponse(AppModel):
+    """
+    Signals for one symbol at one timestamp, stored as parallel arrays.
+
+    signal_types[i] and entry_prices[i] belong to timeframes[i]; slots
+    without a signal hold None / 0.0. One flat model per row serializes
+    much cheaper than a dict of per-timeframe objects.
+    """
     symbol: str
     timestamp: datetime
-    signals: dict[str, TimeframeSignal]  # key là timeframe (e.g., "1m", "3m", "5m") 
\ No newline at end of file
+    timeframes: list[str]
+    signal_types: list[Optional[SignalType]]
+    entry_prices: list[float] 
\ No newline at end of file
@@ -1,31 +1,48 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict
+from pydantic import Field, ConfigDict, field_validator
+from typing import Annotated, Optional, List, Dict
 from enum import Enum
 from decimal import Decimal
 from datetime import datetime
+from ._base import AppModel, FrozenAppModel
 
 class OrderType(str, Enum):
     BUY = "BUY"
     SELL = "SELL"
 
-class Position(BaseModel):
-    ticket: int = Field(..., description="Position ticket/order ID")
-    symbol: str = Field(..., description="Trading symbol")
+# Value-to-member map for hot dispatch paths: a plain dict hit instead of
+# the Enum __call__ machinery
+ORDER_TYPE_BY_VALUE: dict[str, OrderType] = {m.value: m for m in OrderType}
+
+# Shared field annotations: reusing the same Annotated objects lets pydantic
+# reuse one core schema for fields repeated across the models below
+Symbol = Annotated[str, Field(description="Trading symbol")]
+Ticket = Annotated[int, Field(description="Position ticket/order ID")]
+StopLoss = Annotated[Optional[float], Field(description="Stop loss price level")]
+TakeProfit = Annotated[Optional[float], Field(description="Take profit price level")]
+
+class Position(AppModel):
+    ticket: Ticket
+    symbol: Symbol
     order_type: OrderType = Field(..., description="Order type (BUY/SELL)")
-    volume: Decimal = Field(..., description="Trading volume")
-    open_price: Decimal = Field(..., description="Position open price")
-    stop_loss: Optional[Decimal] = Field(None, description="Stop loss level")
-    take_profit: Optional[Decimal] = Field(None, description="Take profit level")
-    profit: Decimal = Field(..., description="Current profit")
+    volume: float = Field(..., description="Trading volume")
+    open_price: float = Field(..., description="Position open price")
+    stop_loss: StopLoss = None
+    take_profit: TakeProfit = None
+    profit: float = Field(..., description="Current profit")
     open_time: datetime = Field(..., description="Position open time")
 
-class AccountInfo(BaseModel):
-    balance: Decimal = Field(..., description="Account balance")
-    equity: Decimal = Field(..., description="Account equity")
-    margin: Decimal = Field(..., description="Used margin")
-    free_margin: Decimal = Field(..., description="Free margin")
+# Frozen so the TTL-cached instance returned to concurrent /account/info
+# pollers is safely shared and pydantic skips the mutable-field machinery
+class AccountInfo(FrozenAppModel):
+    # Monetary fields stay float: the terminal hands us C doubles and
+    # serialization is float either way, so Decimal(str(...)) per field
+    # only added a format+parse round-trip on the hot /account path
+    balance: float = Field(..., description="Account balance")
+    equity: float = Field(..., description="Account equity")
+    margin: float = Field(..., description="Used margin")
+    free_margin: float = Field(..., description="Free margin")
     positions_count: int = Field(..., description="Number of open positions")
-    profit: Decimal = Field(..., description="Current profit")
+    profit: float = Field(..., description="Current profit")
     leverage: int = Field(..., description="Account leverage")
     currency: str = Field(..., description="Account currency")
     name: str = Field(..., description="Account name")
@@ -34,7 +51,7 @@ class AccountInfo(BaseModel):
     limit_orders: int = Field(..., description="Maximum allowed orders")
     margin_so_mode: int = Field(..., description="Margin SO mode")
 
-class TradeRequest(BaseModel):
+class TradeRequest(AppModel):
     symbol: str = Field(
         ..., 
         description="Trading symbol (e.g., BTCUSDm, XAUUSD, BTCUSD)"
@@ -48,14 +65,8 @@ class TradeRequest(BaseModel):
         description="Investment amount in deposit currency (e.g., 1000 USD)",
         gt=0
     )
-    stop_loss: Optional[float] = Field(
-        None, 
-        description="Stop loss price level. Leave empty for no stop loss"
-    )
-    take_profit: Optional[float] = Field(
-        None, 
-        description="Take profit price level. Leave empty for no take profit"
-    )
+    stop_loss: StopLoss = None
+    take_profit: TakeProfit = None
     comment: Optional[str] = Field(
         None, 
         description="Order comment or note",
@@ -63,78 +74,77 @@ class TradeRequest(BaseModel):
     )
     calculated_volume: Optional[float] = None
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "symbol": "BTCUSDm",
-                "order_type": "BUY",
-                "amount": 1000,
-                "stop_loss": 1.0800,
-                "take_profit": 1.0900,
-                "comment": "Python trading bot order"
-            }
-        }
-
-class TradeResponse(BaseModel):
+    @field_validator("order_type", mode="before")
+    @classmethod
+    def _lookup_order_type(cls, v):
+        # One dict hit replaces pydantic's generic enum resolution on the
+        # order hot path; enum members hash as their string values, so this
+        # accepts both "BUY" and OrderType.BUY
+        try:
+            return ORDER_TYPE_BY_VALUE[v]
+        except (KeyError, TypeError):
+            raise ValueError(f"invalid order_type: {v!r}")
+
+    # Request example lives in app.models.examples; keeping it off the
+    # class keeps example metadata out of the core-schema build
+    model_config = ConfigDict(defer_build=True)
+
+class TradeResponse(AppModel):
     order_id: int = Field(..., description="Order ID from MT5")
     status: str = Field(..., description="Order status (success/error)")
     message: str = Field(..., description="Detailed message") 
     symbol: Optional[str] = Field(None, description="Trading symbol")
     profit: Optional[Decimal] = Field(None, description="Profit")
 
-class PendingOrder(BaseModel):
+# Pending/historical rows mirror the terminal's IEEE floats; float fields
+# keep pydantic's cheap float validator on these list-heavy responses
+class PendingOrder(FrozenAppModel):
     ticket: int
     symbol: str
     type: str
-    volume: Decimal
-    price: Decimal
-    stop_loss: Optional[Decimal]
-    take_profit: Optional[Decimal]
+    volume: float
+    price: float
+    stop_loss: Optional[float]
+    take_profit: Optional[float]
     comment: Optional[str]
 
-class HistoricalOrder(BaseModel):
+class HistoricalOrder(FrozenAppModel):
     ticket: int
     symbol: str
     type: str
-    volume: Decimal
-    price: Decimal
+    volume: float
+    price: float
     time: datetime
     state: int
-    profit: Optional[Decimal] = None
+    profit: Optional[float] = None
 
-class HistoricalDeal(BaseModel):
+class HistoricalDeal(FrozenAppModel):
     ticket: int
     order_ticket: int
     symbol: str
     type: str
-    volume: Decimal
-    price: Decimal
+    volume: float
+    price: float
     time: datetime
-    profit: Decimal
+    profit: float
 
-class HistoricalPosition(BaseModel):
+class HistoricalPosition(FrozenAppModel):
     ticket: int
     symbol: str
     type: str
-    volume: Decimal
-    open_price: Decimal
-    close_price: Decimal
+    volume: float
+    open_price: float
+    close_price: float
     open_time: datetime
     close_time: datetime
-    profit: Decimal
+    profit: float
 
-class ModifyPositionRequest(BaseModel):
-    stop_loss: Optional[Decimal]
-    take_profit: Optional[Decimal] 
-
-class ModifyTradeRequest(BaseModel):
+class ModifyPositionRequest(AppModel):
     stop_loss: Optional[Decimal] = Field(None, description="New stop loss level")
     take_profit: Optional[Decimal] = Field(None, description="New take profit level")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "stop_loss": 1.0800,
-                "take_profit": 1.0900
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(defer_build=True)
+
+# The two SL/TP modification bodies were identical; keep the old name as an
+# alias so both import paths resolve to one schema
+ModifyTradeRequest = ModifyPositionRequest
\ No newline at end of file
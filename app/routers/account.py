@@ -1,16 +1,23 @@
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 from ..services.mt5_account_service import MT5AccountService
 from ..models.trade import AccountInfo
+from ..utils.router_cache import cached_router
 
+@cached_router
 def get_router(service: MT5AccountService) -> APIRouter:
-    router = APIRouter(prefix="/account", tags=["Account Information"])
+    router = APIRouter(prefix="/account", tags=["Account Information"], default_response_class=ORJSONResponse)
 
-    @router.get("/info", 
-        response_model=Optional[AccountInfo],
+    # response_model=None: the service already builds a validated
+    # AccountInfo, so FastAPI's second validation pass is pure overhead;
+    # responses= keeps the schema in the docs
+    @router.get("/info",
+        response_model=None,
+        responses={200: {"model": Optional[AccountInfo]}},
         summary="Get Account Information",
         description="Retrieve detailed trading account information and balance")
-    async def get_account_info():
+    async def get_account_info() -> Optional[AccountInfo]:
         """
         Get account information including:
         - Balance
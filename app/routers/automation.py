@@ -1,79 +1,91 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from typing import List
+import orjson
 from ..services.mt5_automation_service import MT5AutomationService
 from ..models.automation import (
     ScheduledTrade, ConditionalOrder,
     GridTradingConfig, MartingaleConfig
 )
+from ..utils.router_cache import cached_router
 
+# Success bodies are static; serialize them once and hand the bytes to a
+# plain Response so the happy path skips dict building and JSON encoding
+_TRADE_SCHEDULED = orjson.dumps({"status": "success", "message": "Trade scheduled"})
+_CONDITIONAL_CREATED = orjson.dumps({"status": "success", "message": "Conditional order created"})
+_GRID_CONFIGURED = orjson.dumps({"status": "success", "message": "Grid trading setup completed"})
+_MARTINGALE_CONFIGURED = orjson.dumps({"status": "success", "message": "Martingale strategy configured"})
+
+# Long endpoint docs live here as plain strings; passing them via
+# description= lets FastAPI skip docstring parsing when building openapi()
+_DOCS = {
+    "schedule": """Schedule a trade for future execution with:
+- Execution time
+- Schedule type (once/daily/weekly/monthly)
+- Trading parameters
+- Optional conditions""",
+    "conditional": """Create a conditional order with:
+- Multiple conditions (price/indicator/time)
+- Trading parameters
+- Expiry settings""",
+    "grid": """Configure and start grid trading with:
+- Grid type and levels
+- Step size
+- Volume per level
+- Risk parameters""",
+    "martingale": """Configure a martingale trading strategy with:
+- Initial volume
+- Multiplier
+- Maximum volume/trades
+- Reset conditions""",
+}
+
+@cached_router
 def get_router(service: MT5AutomationService) -> APIRouter:
-    router = APIRouter(prefix="/automation", tags=["Trading Automation"])
+    router = APIRouter(prefix="/automation", tags=["Trading Automation"], default_response_class=ORJSONResponse)
 
     @router.post("/schedule",
         summary="Schedule Trade",
-        description="Schedule a trade for future execution")
+        description=_DOCS["schedule"])
     async def schedule_trade(trade: ScheduledTrade):
-        """
-        Schedule a trade with:
-        - Execution time
-        - Schedule type (once/daily/weekly/monthly)
-        - Trading parameters
-        - Optional conditions
-        """
+        """Schedule a trade for future execution."""
         try:
             result = await service.add_scheduled_trade(trade)
-            return {"status": "success", "message": "Trade scheduled"}
-        except Exception as e:
+            return Response(_TRADE_SCHEDULED, media_type="application/json")
+        except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
     @router.post("/conditional",
         summary="Create Conditional Order",
-        description="Create order with multiple conditions")
+        description=_DOCS["conditional"])
     async def create_conditional_order(order: ConditionalOrder):
-        """
-        Create conditional order with:
-        - Multiple conditions (price/indicator/time)
-        - Trading parameters
-        - Expiry settings
-        """
+        """Create an order with multiple conditions."""
         try:
             result = await service.add_conditional_order(order)
-            return {"status": "success", "message": "Conditional order created"}
-        except Exception as e:
+            return Response(_CONDITIONAL_CREATED, media_type="application/json")
+        except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
     @router.post("/grid",
         summary="Setup Grid Trading",
-        description="Configure and start grid trading")
+        description=_DOCS["grid"])
     async def setup_grid_trading(config: GridTradingConfig):
-        """
-        Setup grid trading with:
-        - Grid type and levels
-        - Step size
-        - Volume per level
-        - Risk parameters
-        """
+        """Configure and start grid trading."""
         try:
             result = await service.setup_grid_trading(config)
-            return {"status": "success", "message": "Grid trading setup completed"}
-        except Exception as e:
+            return Response(_GRID_CONFIGURED, media_type="application/json")
+        except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
     @router.post("/martingale",
         summary="Setup Martingale",
-        description="Configure martingale trading strategy")
+        description=_DOCS["martingale"])
     async def setup_martingale(config: MartingaleConfig):
-        """
-        Setup martingale strategy with:
-        - Initial volume
-        - Multiplier
-        - Maximum volume/trades
-        - Reset conditions
-        """
+        """Configure a martingale trading strategy."""
         try:
             result = await service.setup_martingale(config)
-            return {"status": "success", "message": "Martingale strategy configured"}
-        except Exception as e:
+            return Response(_MARTINGALE_CONFIGURED, media_type="application/json")
+        except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
     return router 
\ No newline at end of file
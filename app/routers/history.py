@@ -1,107 +1,167 @@
 from fastapi import APIRouter
-from typing import List
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import Annotated, List, Optional
+from pydantic import BeforeValidator
 from ..services.mt5_history_service import MT5HistoryService
 from ..models.trade import HistoricalOrder, HistoricalDeal, HistoricalPosition
 from datetime import datetime
+from ..utils.ndjson import encode_batches
+from ..utils.router_cache import cached_router
 
+
+def _parse_iso(value):
+    # datetime.fromisoformat is a C fast path that covers the ISO-8601
+    # strings backtesters send in tight loops; anything else falls through
+    # to pydantic's regular datetime validation
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return value
+    return value
+
+
+# Still a datetime in OpenAPI, but query strings skip pydantic's slower
+# generic parser on the hot history endpoints
+HistoryDate = Annotated[Optional[datetime], BeforeValidator(_parse_iso)]
+
+# Long endpoint docs live here as plain strings; passing them via
+# description= lets FastAPI skip docstring parsing when building openapi()
+_DOCS = {
+    "orders": """Retrieve historical orders within a specified date range.
+
+Get historical orders data:
+- All executed and cancelled orders
+- Market and pending orders
+- Order execution details
+
+Parameters:
+- start_date: Starting date for history query (optional)
+- end_date: Ending date for history query (optional)
+
+Returns a list of historical orders with full details: order ticket,
+symbol, type, volume, open/close prices, open/close times, profit/loss
+and comments.""",
+    "orders_stream": """Stream historical orders as newline-delimited JSON
+(one order per line), avoiding full-list materialization for large
+date ranges.""",
+    "deals": """Retrieve historical deals/trades within a specified date range.
+
+Get historical deals data:
+- All executed trades
+- Entry and exit transactions
+- Profit/Loss details
+
+Parameters:
+- start_date: Starting date for history query (optional)
+- end_date: Ending date for history query (optional)
+
+Returns a list of historical deals with full details: deal ticket,
+order ticket, symbol, type (buy/sell), volume, price, commission,
+swap, profit and time.""",
+    "deals_stream": """Stream historical deals as newline-delimited JSON
+(one deal per line). Each deal is serialized and sent as it is
+produced, so large date ranges neither delay the first byte nor hold
+the full result list in memory.""",
+    "positions": """Retrieve historical positions within a specified date range.
+
+Get historical positions data:
+- All closed positions
+- Position lifecycle details
+- Full profit/loss analysis
+
+Parameters:
+- start_date: Starting date for history query (optional)
+- end_date: Ending date for history query (optional)
+
+Returns a list of historical positions with full details: position
+ticket, symbol, type (long/short), volume, entry/exit prices,
+open/close times, stop loss/take profit, swap, commission and total
+profit/loss.""",
+    "positions_stream": """Stream reconstructed closed positions as
+newline-delimited JSON (one position per line).""",
+}
+
+@cached_router
 def get_router(service: MT5HistoryService) -> APIRouter:
-    router = APIRouter(prefix="/history", tags=["Trading History"])
+    router = APIRouter(prefix="/history", tags=["Trading History"], default_response_class=ORJSONResponse)
 
+    # response_model=None on these GETs: rows come straight from the MT5
+    # terminal via model_construct, so FastAPI's second validation pass is
+    # pure overhead; responses= keeps the schema in the docs
     @router.get("/orders",
-        response_model=List[HistoricalOrder],
+        response_model=None,
+        responses={200: {"model": List[HistoricalOrder]}},
         summary="Get Order History",
-        description="Retrieve historical orders within a specified date range")
+        description=_DOCS["orders"])
     async def get_history_orders(
-        start_date: datetime = None,
-        end_date: datetime = None
-    ):
-        """
-        Get historical orders data:
-        - All executed and cancelled orders
-        - Market and pending orders
-        - Order execution details
-        
-        Parameters:
-        - start_date: Starting date for history query (optional)
-        - end_date: Ending date for history query (optional)
-        
-        Returns:
-        - List of historical orders with full details:
-            - Order ticket
-            - Symbol
-            - Type
-            - Volume
-            - Open/Close prices
-            - Open/Close times
-            - Profit/Loss
-            - Comments
-        """
+        start_date: HistoryDate = None,
+        end_date: HistoryDate = None
+    ) -> List[HistoricalOrder]:
+        """Get historical orders data."""
         return await service.get_history_orders(start_date, end_date)
 
+    @router.get("/orders/stream",
+        summary="Stream Order History",
+        description=_DOCS["orders_stream"])
+    async def stream_history_orders(
+        start_date: HistoryDate = None,
+        end_date: HistoryDate = None
+    ):
+        """Stream historical orders as NDJSON."""
+        return StreamingResponse(
+            encode_batches(service.iter_orders(start_date, end_date)),
+            media_type="application/x-ndjson"
+        )
+
     @router.get("/deals",
-        response_model=List[HistoricalDeal],
+        response_model=None,
+        responses={200: {"model": List[HistoricalDeal]}},
         summary="Get Deal History",
-        description="Retrieve historical deals/trades within a specified date range")
+        description=_DOCS["deals"])
     async def get_history_deals(
-        start_date: datetime = None,
-        end_date: datetime = None
-    ):
-        """
-        Get historical deals data:
-        - All executed trades
-        - Entry and exit transactions
-        - Profit/Loss details
-        
-        Parameters:
-        - start_date: Starting date for history query (optional)
-        - end_date: Ending date for history query (optional)
-        
-        Returns:
-        - List of historical deals with full details:
-            - Deal ticket
-            - Order ticket
-            - Symbol
-            - Type (buy/sell)
-            - Volume
-            - Price
-            - Commission
-            - Swap
-            - Profit
-            - Time
-        """
+        start_date: HistoryDate = None,
+        end_date: HistoryDate = None
+    ) -> List[HistoricalDeal]:
+        """Get historical deals data."""
         return await service.get_history_deals(start_date, end_date)
 
+    @router.get("/deals/stream",
+        summary="Stream Deal History",
+        description=_DOCS["deals_stream"])
+    async def stream_history_deals(
+        start_date: HistoryDate = None,
+        end_date: HistoryDate = None
+    ):
+        """Stream historical deals as NDJSON."""
+        return StreamingResponse(
+            encode_batches(service.iter_deals(start_date, end_date)),
+            media_type="application/x-ndjson"
+        )
+
     @router.get("/positions",
-        response_model=List[HistoricalPosition],
+        response_model=None,
+        responses={200: {"model": List[HistoricalPosition]}},
         summary="Get Position History",
-        description="Retrieve historical positions within a specified date range")
+        description=_DOCS["positions"])
     async def get_history_positions(
-        start_date: datetime = None,
-        end_date: datetime = None
-    ):
-        """
-        Get historical positions data:
-        - All closed positions
-        - Position lifecycle details
-        - Full profit/loss analysis
-        
-        Parameters:
-        - start_date: Starting date for history query (optional)
-        - end_date: Ending date for history query (optional)
-        
-        Returns:
-        - List of historical positions with full details:
-            - Position ticket
-            - Symbol
-            - Type (long/short)
-            - Volume
-            - Entry/Exit prices
-            - Open/Close times
-            - Stop Loss/Take Profit
-            - Swap
-            - Commission
-            - Total profit/loss
-        """
+        start_date: HistoryDate = None,
+        end_date: HistoryDate = None
+    ) -> List[HistoricalPosition]:
+        """Get historical closed positions data."""
         return await service.get_history_positions(start_date, end_date)
 
+    @router.get("/positions/stream",
+        summary="Stream Position History",
+        description=_DOCS["positions_stream"])
+    async def stream_history_positions(
+        start_date: HistoryDate = None,
+        end_date: HistoryDate = None
+    ):
+        """Stream reconstructed closed positions as NDJSON."""
+        return StreamingResponse(
+            encode_batches(service.iter_positions(start_date, end_date)),
+            media_type="application/x-ndjson"
+        )
+
     return router 
\ No newline at end of file
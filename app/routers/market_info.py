@@ -1,12 +1,25 @@
-from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import Dict, List, Optional
+import msgspec
 from ..services.mt5_market_service import MT5MarketService
 from ..models.market import SymbolInfo, TickData, OHLC, SymbolList
+from ..utils.ndjson import encode_batches
+from ..utils.router_cache import cached_router
 
+# Binary encoder for clients negotiating msgpack on numeric-heavy payloads
+_MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+
+@cached_router
 def get_router(market_service: MT5MarketService) -> APIRouter:
-    router = APIRouter(prefix="/market", tags=["Market Info"])
+    router = APIRouter(prefix="/market", tags=["Market Info"], default_response_class=ORJSONResponse)
 
-    @router.get("/symbols", response_model=SymbolList,
+    # response_model=None on these GETs: values come from trusted MT5
+    # terminal data, so FastAPI's second validation pass is pure overhead;
+    # responses= keeps the schema in the docs
+    @router.get("/symbols",
+        response_model=None,
+        responses={200: {"model": SymbolList}},
         summary="Get and Search Symbols",
         description="Get all trading symbols or search with optional filters")
     async def search_symbols(
@@ -25,10 +38,11 @@ def get_router(market_service: MT5MarketService) -> APIRouter:
         return SymbolList(symbols=symbols)
 
     @router.get("/symbols/{symbol}/info",
-        response_model=SymbolInfo,
+        response_model=None,
+        responses={200: {"model": SymbolInfo}},
         summary="Get Symbol Details",
         description="Get detailed market information for a specific symbol including pricing and trading conditions")
-    async def get_symbol_info(symbol: str):
+    async def get_symbol_info(symbol: str) -> Optional[SymbolInfo]:
         """
         Get detailed symbol information including:
         - Current bid/ask prices
@@ -57,11 +71,45 @@ def get_router(market_service: MT5MarketService) -> APIRouter:
             raise HTTPException(status_code=404, detail=f"Price not available for {symbol}")
         return price
 
+    @router.get("/prices",
+        summary="Get Current Prices (Batch)",
+        description="Get real-time prices for several symbols in one request")
+    async def get_prices(
+        symbols: List[str] = Query(..., description="Symbol names, e.g. ?symbols=BTCUSDm&symbols=XAUUSD")
+    ):
+        """
+        Get current bid/ask/last for a batch of symbols.
+
+        Collapses the per-symbol polling loop into one request — one
+        middleware pass and one serialization instead of N.
+        """
+        return await market_service.get_symbol_prices(symbols)
+
+    @router.get("/ohlc",
+        response_model=None,
+        responses={200: {"model": Dict[str, List[OHLC]]}},
+        summary="Get OHLC Data (Batch)",
+        description="Get candlestick data for several symbols in one request")
+    async def get_many_ohlc(
+        symbols: List[str] = Query(..., description="Symbol names, e.g. ?symbols=BTCUSDm&symbols=XAUUSD"),
+        timeframe: str = "M1",
+        count: int = 100
+    ) -> Dict[str, List[OHLC]]:
+        """
+        Get OHLC candles for a batch of symbols.
+
+        The symbols are fetched concurrently server-side, so a dashboard
+        refresh costs roughly one round-trip instead of one per symbol.
+        """
+        return await market_service.get_many_ohlc(symbols, timeframe, count)
+
     @router.get("/symbols/{symbol}/ticks",
-        response_model=List[TickData],
+        response_model=None,
+        responses={200: {"model": List[TickData]}},
         summary="Get Tick History",
         description="Retrieve historical tick data for a specific symbol")
     async def get_symbol_ticks(
+        request: Request,
         symbol: str,
         count: int = 100
     ):
@@ -71,18 +119,42 @@ def get_router(market_service: MT5MarketService) -> APIRouter:
         - Bid/Ask prices
         - Last trade price
         - Volume
+
+        Clients sending ``Accept: application/msgpack`` get the same rows
+        as binary MessagePack — smaller and cheaper to encode than JSON
+        for these numeric-heavy payloads.
         """
+        if "application/msgpack" in request.headers.get("accept", ""):
+            ticks = [tick async for tick in market_service.iter_symbol_ticks(symbol, count)]
+            return Response(_MSGPACK_ENCODER.encode(ticks), media_type="application/msgpack")
         return await market_service.get_symbol_ticks(symbol, count)
 
+    @router.get("/symbols/{symbol}/ticks/stream",
+        summary="Stream Tick History",
+        description="Stream historical tick data as newline-delimited JSON")
+    async def stream_symbol_ticks(
+        symbol: str,
+        count: int = 100
+    ):
+        """
+        Stream tick rows as NDJSON (one tick per line), avoiding
+        full-list materialization for large tick counts.
+        """
+        return StreamingResponse(
+            encode_batches(market_service.iter_symbol_ticks(symbol, count)),
+            media_type="application/x-ndjson"
+        )
+
     @router.get("/symbols/{symbol}/ohlc",
-        response_model=List[OHLC],
+        response_model=None,
+        responses={200: {"model": List[OHLC]}},
         summary="Get Candlestick Data",
         description="Retrieve OHLC (candlestick) data for a specific symbol and timeframe")
     async def get_symbol_ohlc(
         symbol: str,
         timeframe: str = "M1",
         count: int = 100
-    ):
+    ) -> List[OHLC]:
         """
         Get candlestick (OHLC) data with:
         - Timestamp
@@ -94,4 +166,23 @@ def get_router(market_service: MT5MarketService) -> APIRouter:
         """
         return await market_service.get_symbol_ohlc(symbol, timeframe, count)
 
+    @router.get("/symbols/{symbol}/ohlc/stream",
+        summary="Stream Candlestick Data",
+        description="Stream OHLC (candlestick) data as newline-delimited JSON")
+    async def stream_symbol_ohlc(
+        symbol: str,
+        timeframe: str = "M1",
+        count: int = 100
+    ):
+        """
+        Stream OHLC bars as NDJSON (one bar per line).
+
+        Each bar is serialized and sent as it is produced, cutting time
+        to first byte and peak memory for large candle counts.
+        """
+        return StreamingResponse(
+            encode_batches(market_service.iter_symbol_ohlc(symbol, timeframe, count)),
+            media_type="application/x-ndjson"
+        )
+
     return router 
\ No newline at end of file
@@ -1,125 +1,135 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from typing import List
+import orjson
 from ..services.mt5_notification_service import MT5NotificationService
 from ..models.notification import (
     NotificationConfig, PriceAlert, PnLAlert,
     SignalAlert, NewsAlert
 )
+from ..utils.router_cache import cached_router
 
+# Success bodies are static; serialize them once and hand the bytes to a
+# plain Response so the happy path skips dict building and JSON encoding
+_CONFIG_UPDATED = orjson.dumps({"status": "success", "message": "Notification settings updated"})
+_PRICE_ALERT_ADDED = orjson.dumps({"status": "success", "message": "Price alert added"})
+_PNL_ALERT_ADDED = orjson.dumps({"status": "success", "message": "P&L alert added"})
+_NEWS_ALERT_ADDED = orjson.dumps({"status": "success", "message": "News alert added"})
+_SIGNAL_SENT = orjson.dumps({"status": "success", "message": "Signal notification sent"})
+
+# Long endpoint docs live here as plain strings; passing them via
+# description= lets FastAPI skip docstring parsing when building openapi()
+_DOCS = {
+    "config": """Configure notification settings:
+- Telegram credentials
+- Email settings
+- Webhook URLs
+- Other channel configs""",
+    "price_alert": """Add a price alert with:
+- Symbol
+- Price level
+- Condition (above/below/cross)
+- Notification channels""",
+    "pnl_alert": """Add a P&L alert with:
+- Position ID (optional)
+- Profit threshold
+- Loss threshold
+- Notification channels""",
+    "news_alert": """Add a news alert with:
+- Symbols to monitor
+- News importance levels
+- Notification channels""",
+    "signal": """Send a trading signal with:
+- Symbol
+- Signal type
+- Entry price
+- Stop loss/Take profit
+- Confidence level""",
+    "test": """Send a test notification to verify:
+- Telegram connection
+- Bot permissions
+- Message formatting""",
+}
+
+@cached_router
 def get_router(service: MT5NotificationService) -> APIRouter:
-    router = APIRouter(prefix="/notifications", tags=["Notifications"])
+    router = APIRouter(prefix="/notifications", tags=["Notifications"], default_response_class=ORJSONResponse)
 
     @router.post("/config",
         summary="Configure Notification Settings",
-        description="Set up notification channels and credentials")
+        description=_DOCS["config"])
     async def configure_notifications(config: NotificationConfig):
-        """
-        Configure notification settings:
-        - Telegram credentials
-        - Email settings
-        - Webhook URLs
-        - Other channel configs
-        """
+        """Set up notification channels and credentials."""
         try:
             await service.initialize(config)
-            return {"status": "success", "message": "Notification settings updated"}
-        except Exception as e:
+            return Response(_CONFIG_UPDATED, media_type="application/json")
+        except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
     @router.post("/alerts/price",
         summary="Add Price Alert",
-        description="Create new price level alert")
+        description=_DOCS["price_alert"])
     async def add_price_alert(alert: PriceAlert):
-        """
-        Add price alert with:
-        - Symbol
-        - Price level
-        - Condition (above/below/cross)
-        - Notification channels
-        """
+        """Create a new price level alert."""
         try:
             result = await service.add_price_alert(alert)
-            return {"status": "success", "message": "Price alert added"}
-        except Exception as e:
+            return Response(_PRICE_ALERT_ADDED, media_type="application/json")
+        except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
     @router.post("/alerts/pnl",
         summary="Add P&L Alert",
-        description="Create new profit/loss threshold alert")
+        description=_DOCS["pnl_alert"])
     async def add_pnl_alert(alert: PnLAlert):
-        """
-        Add P&L alert with:
-        - Position ID (optional)
-        - Profit threshold
-        - Loss threshold
-        - Notification channels
-        """
+        """Create a new profit/loss threshold alert."""
         try:
             result = await service.add_pnl_alert(alert)
-            return {"status": "success", "message": "P&L alert added"}
-        except Exception as e:
+            return Response(_PNL_ALERT_ADDED, media_type="application/json")
+        except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
     @router.post("/alerts/news",
         summary="Add News Alert",
-        description="Create new market news alert")
+        description=_DOCS["news_alert"])
     async def add_news_alert(alert: NewsAlert):
-        """
-        Add news alert with:
-        - Symbols to monitor
-        - News importance levels
-        - Notification channels
-        """
+        """Create a new market news alert."""
         try:
             result = await service.add_news_alert(alert)
-            return {"status": "success", "message": "News alert added"}
-        except Exception as e:
+            return Response(_NEWS_ALERT_ADDED, media_type="application/json")
+        except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
     @router.post("/signal",
         summary="Send Signal Notification",
-        description="Send trading signal notification")
+        description=_DOCS["signal"])
     async def send_signal(signal: SignalAlert):
-        """
-        Send trading signal with:
-        - Symbol
-        - Signal type
-        - Entry price
-        - Stop loss/Take profit
-        - Confidence level
-        """
+        """Send a trading signal notification."""
         try:
             await service.send_signal_notification(signal)
-            return {"status": "success", "message": "Signal notification sent"}
-        except Exception as e:
+            return Response(_SIGNAL_SENT, media_type="application/json")
+        except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
     @router.post("/test",
         summary="Test Notification System",
-        description="Send a test message to verify notification setup")
+        description=_DOCS["test"])
     async def test_notification():
-        """
-        Send test notification to verify:
-        - Telegram connection
-        - Bot permissions
-        - Message formatting
-        """
-        try:
-            await service.send_telegram(
-                "🔔 <b>MT5 Trading</b>\n\n"
-                "✅ Connection Successful!\n"
-                "✅ Bot Permissions OK\n"
-                "✅ Channel Configuration OK\n\n"
-                "You will receive trading alerts in this channel."
-            )
-            return {
-                "status": "success", 
-                "message": "Test notification sent successfully"
-            }
-        except Exception as e:
+        """Send a test message to verify notification setup."""
+        sent = await service.send_telegram(
+            "🔔 <b>MT5 Trading</b>\n\n"
+            "✅ Connection Successful!\n"
+            "✅ Bot Permissions OK\n"
+            "✅ Channel Configuration OK\n\n"
+            "You will receive trading alerts in this channel."
+        )
+        if not sent:
             raise HTTPException(
                 status_code=500,
-                detail=f"Failed to send test notification: {str(e)}"
+                detail="Failed to send test notification"
             )
+        return {
+            "status": "success",
+            "message": "Test notification sent successfully"
+        }
 
     return router 
\ No newline at end of file
@@ -1,16 +1,21 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Body, HTTPException
+from fastapi.responses import ORJSONResponse
 from typing import List
 from ..services.mt5_order_service import MT5OrderService
 from ..models.trade import TradeRequest, TradeResponse, PendingOrder
+from ..models.examples import TRADE_REQUEST_EXAMPLE
+from ..utils.router_cache import cached_router
 
+@cached_router
 def get_router(service: MT5OrderService) -> APIRouter:
-    router = APIRouter(prefix="/orders", tags=["Orders Management"])
+    router = APIRouter(prefix="/orders", tags=["Orders Management"], default_response_class=ORJSONResponse)
 
     @router.get("/pending",
-        response_model=List[PendingOrder],
+        response_model=None,
+        responses={200: {"model": List[PendingOrder]}},
         summary="Get Pending Orders",
         description="Retrieve all pending orders currently placed in the trading account")
-    async def get_pending_orders():
+    async def get_pending_orders() -> List[PendingOrder]:
         """
         Returns list of all pending orders with:
         - Order ticket
@@ -29,7 +34,7 @@ def get_router(service: MT5OrderService) -> APIRouter:
         response_model=TradeResponse,
         summary="Create Pending Order",
         description="Place a new pending order with specified parameters")
-    async def create_pending_order(order: TradeRequest):
+    async def create_pending_order(order: TradeRequest = Body(..., examples=[TRADE_REQUEST_EXAMPLE])):
         """
         Create a new pending order with:
         - Symbol to trade
@@ -1,14 +1,73 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, Body, HTTPException, Depends
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import orjson
 from typing import List
 from ..services.mt5_position_service import MT5PositionService
 from ..services.mt5_notification_service import MT5NotificationService
 from ..models.trade import TradeResponse, Position, ModifyPositionRequest
+from ..models.examples import MODIFY_POSITION_EXAMPLE
+from ..utils.router_cache import cached_router
 
+# Notification bodies as constant templates: one .format() C call per
+# message instead of re-running multiline f-string formatting ops on the
+# event loop for every request
+CLOSE_OK_TPL = (
+    "🔴 Position Closed\n\n"
+    "Close Ticket: {ticket}\n"
+    "Symbol: {symbol}\n"
+    "Profit: {profit}\n"
+    "✅ Status: Success"
+)
+CLOSE_FAIL_TPL = (
+    "❌ Position Close Failed\n\n"
+    "Ticket: {ticket}\n"
+    "Symbol: {symbol}\n"
+    "Error: {error}"
+)
+CLOSE_ERROR_TPL = (
+    "❌ Position Close Error\n\n"
+    "Ticket: {ticket}\n"
+    "Symbol: {symbol}\n"
+    "Details: {details}"
+)
+MODIFY_OK_TPL = (
+    "📝 Position Modified\n\n"
+    "Modify Ticket: {ticket}\n"
+    "Symbol: {symbol}\n"
+    "Stop Loss: {stop_loss}\n"
+    "Take Profit: {take_profit}\n"
+    "Profit: {profit}\n"
+    "✅ Status: Success"
+)
+MODIFY_FAIL_TPL = (
+    "❌ Position Modify Failed\n\n"
+    "Ticket: {ticket}\n"
+    "Symbol: {symbol}\n"
+    "Error: {error}"
+)
+MODIFY_ERROR_TPL = (
+    "❌ Position Modify Error\n\n"
+    "Ticket: {ticket}\n"
+    "Symbol: {symbol}\n"
+    "Details: {details}"
+)
+CLOSE_ALL_TPL = (
+    "🔴 All Positions Closed\n\n"
+    "Positions Closed: {count}\n"
+    "Close Tickets: {tickets}\n"
+    "✅ Status: Complete"
+)
+CLOSE_ALL_ERROR_TPL = (
+    "❌ Close All Positions Error\n\n"
+    "Details: {details}"
+)
+
+@cached_router
 def get_router(
     position_service: MT5PositionService,
     notification_service: MT5NotificationService
 ) -> APIRouter:
-    router = APIRouter(prefix="/positions", tags=["Position Management"])
+    router = APIRouter(prefix="/positions", tags=["Position Management"], default_response_class=ORJSONResponse)
 
     @router.get("/",
         response_model=List[Position],
@@ -48,36 +107,37 @@ def get_router(
         - Closure confirmation and P/L if successful
         - Error message if closure failed
         """
+        result = None
         try:
             result = await position_service.close_position(ticket)
             
+            # Queued for batched delivery: the response neither waits out a
+            # Telegram round trip nor fires one HTTPS call per burst message
             if result.status == "success":
-                await notification_service.send_telegram(
-                    f"🔴 Position Closed\n\n"
-                    f"Close Ticket: {ticket}\n"
-                    f"Symbol: {result.symbol}\n"
-                    f"Profit: {result.profit}\n"
-                    f"✅ Status: Success"
-                )
+                notification_service.enqueue(CLOSE_OK_TPL.format(
+                    ticket=ticket, symbol=result.symbol, profit=result.profit
+                ))
             else:
-                await notification_service.send_telegram(
-                    f"❌ Position Close Failed\n\n"
-                    f"Ticket: {ticket}\n"
-                    f"Symbol: {result.symbol}\n"
-                    f"Error: {result.message}"
-                )
+                notification_service.enqueue(CLOSE_FAIL_TPL.format(
+                    ticket=ticket, symbol=result.symbol, error=result.message
+                ))
 
             if result.status == "error":
                 raise HTTPException(status_code=400, detail=result.message)
             return result
-            
+
+        except HTTPException:
+            # The 400 raised above (and any other deliberate status) must
+            # pass through untouched; the handler below would remap it to
+            # a second notification and a mangled detail string
+            raise
         except Exception as e:
-            await notification_service.send_telegram(
-                f"❌ Position Close Error\n\n"
-                f"Ticket: {ticket}\n"
-                f"Symbol: {result.symbol}\n"
-                f"Details: {str(e)}"
-            )
+            # result is unbound when close_position itself raised; don't
+            # let a NameError mask the real failure
+            symbol = result.symbol if result else "unknown"
+            notification_service.enqueue(CLOSE_ERROR_TPL.format(
+                ticket=ticket, symbol=symbol, details=str(e)
+            ))
             raise HTTPException(status_code=400, detail=str(e))
 
     @router.post("/{ticket}/modify",
@@ -86,7 +146,7 @@ def get_router(
         description="Modify Stop Loss and Take Profit levels for an existing position")
     async def modify_position(
         ticket: int,
-        modify_request: ModifyPositionRequest
+        modify_request: ModifyPositionRequest = Body(..., examples=[MODIFY_POSITION_EXAMPLE])
     ):
         """
         Modify risk management levels for a position:
@@ -101,38 +161,37 @@ def get_router(
         - Success confirmation if modified
         - Error message if modification failed
         """
+        result = None
         try:
             result = await position_service.modify_position(ticket, modify_request)
             
+            # Queued for batched delivery: the response neither waits out a
+            # Telegram round trip nor fires one HTTPS call per burst message
             if result.status == "success":
-                await notification_service.send_telegram(
-                    f"📝 Position Modified\n\n"
-                    f"Modify Ticket: {ticket}\n"
-                    f"Symbol: {result.symbol}\n"
-                    f"Stop Loss: {modify_request.stop_loss}\n"
-                    f"Take Profit: {modify_request.take_profit}\n"
-                    f"Profit: {result.profit}\n"
-                    f"✅ Status: Success"
-                )
+                notification_service.enqueue(MODIFY_OK_TPL.format(
+                    ticket=ticket, symbol=result.symbol,
+                    stop_loss=modify_request.stop_loss,
+                    take_profit=modify_request.take_profit,
+                    profit=result.profit
+                ))
             else:
-                await notification_service.send_telegram(
-                    f"❌ Position Modify Failed\n\n"
-                    f"Ticket: {ticket}\n"
-                    f"Symbol: {result.symbol}\n"
-                    f"Error: {result.message}"
-                )
+                notification_service.enqueue(MODIFY_FAIL_TPL.format(
+                    ticket=ticket, symbol=result.symbol, error=result.message
+                ))
 
             if result.status == "error":
                 raise HTTPException(status_code=400, detail=result.message)
             return result
-            
+
+        except HTTPException:
+            raise
         except Exception as e:
-            await notification_service.send_telegram(
-                f"❌ Position Modify Error\n\n"
-                f"Ticket: {ticket}\n"
-                f"Symbol: {result.symbol}\n"
-                f"Details: {str(e)}"
-            )
+            # result is unbound when modify_position itself raised; don't
+            # let a NameError mask the real failure
+            symbol = result.symbol if result else "unknown"
+            notification_service.enqueue(MODIFY_ERROR_TPL.format(
+                ticket=ticket, symbol=symbol, details=str(e)
+            ))
             raise HTTPException(status_code=400, detail=str(e))
 
     @router.post("/close-all",
@@ -152,26 +211,49 @@ def get_router(
         """
         try:
             results = await position_service.close_all_positions()
-            
-            success_count = len([r for r in results if r.status == "success"])
-            success_tickets = [f"{r.order_id} ({r.symbol} {r.profit})" for r in results if r.status == "success"]    
-            
-            await notification_service.send_telegram(
-                f"🔴 All Positions Closed\n\n"
-                f"Positions Closed: {success_count}\n"
-                f"Close Tickets: {', '.join(map(str, success_tickets))}\n"
-                f"✅ Status: Complete"
-            )
+
+            # Single pass over results: count and preformat in one walk
+            # instead of two comprehensions plus a map
+            success_count = 0
+            success_tickets = []
+            for r in results:
+                if r.status == "success":
+                    success_count += 1
+                    success_tickets.append(f"{r.order_id} ({r.symbol} {r.profit})")
+
+            notification_service.enqueue(CLOSE_ALL_TPL.format(
+                count=success_count, tickets=", ".join(success_tickets)
+            ))
             
             return results
-            
+
+        except HTTPException:
+            raise
         except Exception as e:
-            await notification_service.send_telegram(
-                f"❌ Close All Positions Error\n\n"
-                f"Details: {str(e)}"
-            )
+            notification_service.enqueue(CLOSE_ALL_ERROR_TPL.format(
+                details=str(e)
+            ))
             raise HTTPException(status_code=500, detail=str(e))
 
+    @router.post("/close-all/stream",
+        summary="Close All Positions (Streaming)",
+        description="Close all open positions, streaming each result as "
+                    "newline-delimited JSON the moment it completes")
+    async def close_all_positions_stream():
+        """
+        Stream closure results as NDJSON (one TradeResponse per line).
+
+        Each position's outcome is sent as soon as its closure finishes,
+        so clients see progress immediately instead of waiting for the
+        slowest close. The plain /close-all endpoint keeps returning the
+        aggregated JSON list.
+        """
+        async def ndjson():
+            async for result in position_service.close_all_stream():
+                yield orjson.dumps(result.model_dump(mode="json")) + b"\n"
+
+        return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
     @router.post("/hedge/{ticket}",
         response_model=TradeResponse,
         summary="Create Hedge Position",
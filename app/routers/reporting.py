@@ -1,11 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
+from typing import List, Literal
 from datetime import datetime, timedelta
 from ..services.mt5_reporting_service import MT5ReportingService
 from ..models.reporting import TradeStats, PairAnalysis, DrawdownInfo, PeriodicReport
+from ..utils.swr import SWRCache
+from ..utils.router_cache import cached_router
 
+# Reporting endpoints are heavy MT5 history scans polled by dashboards;
+# stale-while-revalidate keeps repeat polls in-memory and refreshes in the
+# background instead of re-querying the terminal per request
+_swr = SWRCache()
+
+@cached_router
 def get_router(reporting_service: MT5ReportingService) -> APIRouter:
-    router = APIRouter(prefix="/reporting", tags=["Reporting"])
+    router = APIRouter(prefix="/reporting", tags=["Reporting"], default_response_class=ORJSONResponse)
 
     @router.get("/performance", response_model=TradeStats)
     async def get_performance_stats(
@@ -14,12 +23,23 @@ def get_router(reporting_service: MT5ReportingService) -> APIRouter:
         end_date: datetime = None
     ):
         """Get trading performance statistics"""
+        # Key on the raw query params, before default substitution: the
+        # now()-based defaults differ per request, so keying on them would
+        # make every default-window poll a fresh entry and the cache would
+        # never hit (while _entries grew unboundedly)
+        key = ("performance", period, start_date, end_date)
+        # One clock read for both defaults keeps the 30-day window exact
+        now = datetime.now()
         if not start_date:
-            start_date = datetime.now() - timedelta(days=30)
+            start_date = now - timedelta(days=30)
         if not end_date:
-            end_date = datetime.now()
-        
-        return await reporting_service.get_performance_stats(start_date, end_date, period)
+            end_date = now
+
+        return await _swr.get_or_set(
+            key,
+            lambda: reporting_service.get_performance_stats(start_date, end_date, period),
+            fresh=300, stale=600
+        )
 
     @router.get("/pair/{symbol}", response_model=PairAnalysis)
     async def analyze_pair(
@@ -27,20 +47,30 @@ def get_router(reporting_service: MT5ReportingService) -> APIRouter:
         period: int = 30
     ):
         """Analyze trading performance for specific symbol"""
-        return await reporting_service.analyze_pair(symbol, period)
+        return await _swr.get_or_set(
+            ("pair", symbol, period),
+            lambda: reporting_service.analyze_pair(symbol, period),
+            fresh=300, stale=600
+        )
 
     @router.get("/drawdown", response_model=DrawdownInfo)
     async def get_drawdown_info():
         """Get current drawdown information"""
-        return await reporting_service.monitor_drawdown()
+        return await _swr.get_or_set(
+            ("drawdown",),
+            reporting_service.monitor_drawdown,
+            fresh=30, stale=60
+        )
 
     @router.get("/report/{period}", response_model=PeriodicReport)
     async def get_periodic_report(
-        period: str
+        period: Literal["daily", "weekly", "monthly"]
     ):
         """Generate periodic report (daily/weekly/monthly)"""
-        if period not in ['daily', 'weekly', 'monthly']:
-            raise HTTPException(status_code=400, detail="Invalid period")
-        return await reporting_service.generate_periodic_report(period)
+        return await _swr.get_or_set(
+            ("report", period),
+            lambda: reporting_service.generate_periodic_report(period),
+            fresh=3600, stale=7200
+        )
 
     return router 
\ No newline at end of file
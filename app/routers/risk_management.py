@@ -1,13 +1,16 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from typing import List
 from ..services.mt5_risk_service import MT5RiskService
 from ..models.risk_management import (
     PositionSizeRequest, PositionSizeResponse,
     TrailingStopRequest, PortfolioRiskRequest, PortfolioRiskResponse
 )
+from ..utils.router_cache import cached_router
 
+@cached_router
 def get_router(service: MT5RiskService) -> APIRouter:
-    router = APIRouter(prefix="/risk", tags=["Risk Management"])
+    router = APIRouter(prefix="/risk", tags=["Risk Management"], default_response_class=ORJSONResponse)
 
     @router.post("/position-size",
         response_model=PositionSizeResponse,
@@ -1,31 +1,44 @@
-from fastapi import APIRouter, HTTPException, Query
+import asyncio
+from fastapi import APIRouter, Body, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from typing import List
 from datetime import datetime, timedelta, time, date
 from ..services.mt5_signal_service import MT5SignalService
 from ..services.mt5_notification_service import MT5NotificationService
-from ..models.signal import TradingSignal, SignalType, TimeFrame, SymbolSignalsResponse, TimeframeSignal
+from ..models.signal import TradingSignal, SignalType, TimeFrame, SymbolSignalsResponse
+from ..models.examples import TRADING_SIGNAL_EXAMPLE
 from ..utils.display_formats import get_timeframe_display
+from ..utils.router_cache import cached_router
 
+# Arrow and label per direction as one dict hit instead of two inline
+# conditionals per notification
+DIRECTION_DISPLAY = {
+    SignalType.UP: ("🔼", "UP"),
+    SignalType.DOWN: ("🔽", "DOWN"),
+}
+
+@cached_router
 def get_router(
     signal_service: MT5SignalService,
     notification_service: MT5NotificationService
 ) -> APIRouter:
-    router = APIRouter(prefix="/signals", tags=["Trading Signals"])
+    router = APIRouter(prefix="/signals", tags=["Trading Signals"], default_response_class=ORJSONResponse)
 
     @router.post("/",
         summary="Add Trading Signal",
         description="Save a new trading signal")
-    async def add_signal(signal: TradingSignal):
+    async def add_signal(signal: TradingSignal = Body(..., examples=[TRADING_SIGNAL_EXAMPLE])):
         """Add new trading signal with market direction"""
         try:
             result = await signal_service.add_signal(signal)
             
-            # Send notification
-            direction = "🔼" if signal.signal_type == SignalType.UP else "🔽"
-            await notification_service.send_telegram(
-                f"{direction} New Trading Signal\n\n"
+            # Queued for batched delivery; the response does not wait out a
+            # Telegram round trip
+            arrow, label = DIRECTION_DISPLAY[signal.signal_type]
+            notification_service.enqueue(
+                f"{arrow} New Trading Signal\n\n"
                 f"Symbol: {signal.symbol}\n"
-                f"Direction: {"UP" if signal.signal_type == SignalType.UP else "DOWN"}\n"
+                f"Direction: {label}\n"
                 f"Timeframe: {get_timeframe_display(signal.timeframe)}\n"
                 f"Price: {signal.entry_price}\n"
                 f"✅ Status: Saved"
@@ -67,38 +80,53 @@ def get_router(
                 to_date=to_datetime
             )
 
-            # Group signals by timestamp
+            # Group signals into parallel arrays keyed by epoch minute:
+            # position i in signal_types/entry_prices corresponds to
+            # timeframes[i], with None/0.0 marking timeframes that have no
+            # signal (NA). Integer buckets hash faster than datetimes and
+            # skip a datetime.replace allocation per signal; the canonical
+            # timestamp is materialized once per bucket at emit time.
+            tf_index = {tf: i for i, tf in enumerate(timeframes)}
             grouped_signals = {}
-            
-            # Get timestamps from all timeframes
+
+            # NA templates built once; new buckets take a flat list copy
+            # instead of re-running the [x] * len multiplication per row
+            na_signal_types = [None] * len(timeframes)
+            na_entry_prices = [0.0] * len(timeframes)
+
             for signal in signals:
-                timestamp = signal.created_at.replace(second=0, microsecond=0)
-                if timestamp not in grouped_signals:
-                    grouped_signals[timestamp] = {
-                        "symbol": signal.symbol,
-                        "timestamp": timestamp,
-                        "signals": {
-                            # Initialize all timeframes with NA
-                            tf: TimeframeSignal(
-                                timeframe=tf,
-                                signal_type=None,
-                                entry_price=0.0
-                            ) for tf in timeframes
-                        }
-                    }
-                
-                # Update signal for corresponding timeframe
-                grouped_signals[timestamp]["signals"][signal.timeframe.value] = TimeframeSignal(
-                    timeframe=signal.timeframe.value,
-                    signal_type=signal.signal_type,
-                    entry_price=signal.entry_price
-                )
+                bucket = int(signal.created_at.timestamp()) // 60
+                row = grouped_signals.get(bucket)
+                if row is None:
+                    row = (na_signal_types.copy(), na_entry_prices.copy())
+                    grouped_signals[bucket] = row
+
+                idx = tf_index.get(signal.timeframe.value)
+                if idx is not None:
+                    row[0][idx] = signal.signal_type
+                    row[1][idx] = signal.entry_price
 
             # Sort results by timestamp in descending order
-            result = [SymbolSignalsResponse(**data) for data in grouped_signals.values()]
-            result.sort(key=lambda x: x.timestamp, reverse=True)
+            def _finalize():
+                return [
+                    SymbolSignalsResponse(
+                        symbol=symbol,
+                        timestamp=datetime.fromtimestamp(bucket * 60),
+                        timeframes=timeframes,
+                        signal_types=signal_types,
+                        entry_prices=entry_prices
+                    )
+                    for bucket, (signal_types, entry_prices) in sorted(
+                        grouped_signals.items(), reverse=True
+                    )
+                ]
 
-            return result
+            # Building hundreds of pydantic rows is CPU work; push it off
+            # the event loop for large tables, but skip the thread handoff
+            # overhead when the result is small
+            if len(grouped_signals) < 50:
+                return _finalize()
+            return await asyncio.to_thread(_finalize)
 
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
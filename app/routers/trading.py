@@ -1,19 +1,23 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, Body, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
 from ..services.mt5_trading_service import MT5TradingService
 from ..services.mt5_notification_service import MT5NotificationService
 from ..models.trade import OrderType, TradeRequest, TradeResponse
+from ..models.examples import TRADE_REQUEST_EXAMPLE
+from ..utils.router_cache import cached_router
 
+@cached_router
 def get_router(
     trading_service: MT5TradingService,
     notification_service: MT5NotificationService
 ) -> APIRouter:
-    router = APIRouter(prefix="/trading", tags=["Basic Trading"])
+    router = APIRouter(prefix="/trading", tags=["Basic Trading"], default_response_class=ORJSONResponse)
 
     @router.post("/market-order",
         response_model=TradeResponse,
         summary="Execute Market Order",
         description="Execute an immediate market order for buying or selling")
-    async def execute_trade(trade_request: TradeRequest):
+    async def execute_trade(trade_request: TradeRequest = Body(..., examples=[TRADE_REQUEST_EXAMPLE])):
         """
         Execute a market order with:
         - Symbol to trade
@@ -34,7 +38,7 @@ def get_router(
             result = await trading_service.execute_market_order(trade_request)
             
             if result.status == "success":
-                await notification_service.send_telegram(
+                notification_service.notify_telegram(
                     f"🎯 New Market Order\n\n"
                     f"Symbol: {trade_request.symbol}\n"
                     f"Type: {'BUY' if trade_request.order_type == OrderType.BUY else 'SELL'}\n"
@@ -43,7 +47,7 @@ def get_router(
                     f"✅ Status: Success"
                 )
             else:
-                await notification_service.send_telegram(
+                notification_service.notify_telegram(
                     f"❌ Market Order Failed\n\n"
                     f"Symbol: {trade_request.symbol}\n"
                     f"Error: {result.message}"
@@ -52,9 +56,13 @@ def get_router(
             if result.status == "error":
                 raise HTTPException(status_code=400, detail=result.message)
             return result
-            
+
+        except HTTPException:
+            # Propagate deliberate 4xx responses untouched instead of
+            # remapping them to 500 below
+            raise
         except Exception as e:
-            await notification_service.send_telegram(
+            notification_service.notify_telegram(
                 f"❌ Trading Error\n\n"
                 f"Details: {str(e)}"
             )
@@ -1,9 +1,9 @@
 from typing import Optional
-from decimal import Decimal
 import MetaTrader5 as mt5
 import logging
 from .mt5_base_service import MT5BaseService
 from ..models.trade import AccountInfo
+from ..utils.ttl_cache import ttl_cache
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +22,7 @@ class MT5AccountService:
         """
         self.base_service = base_service
 
+    @ttl_cache(ttl=1.0)
     async def get_account_info(self) -> Optional[AccountInfo]:
         """
         Get current account information and balance.
@@ -39,17 +40,27 @@ class MT5AccountService:
             return None
             
         try:
-            account_info = mt5.account_info()
+            # Both terminal reads run on the MT5 worker thread in one hop so
+            # the event loop never blocks on terminal IPC. call_shared
+            # coalesces the burst that lands when the TTL entry expires:
+            # however many handlers miss the cache together, the terminal
+            # sees a single round-trip and every waiter shares its result.
+            def fetch_account_snapshot():
+                return mt5.account_info(), mt5.positions_total()
+
+            account_info, positions_count = await self.base_service.call_shared(
+                fetch_account_snapshot
+            )
             if account_info is None:
                 return None
-                
+
             return AccountInfo(
-                balance=Decimal(str(account_info.balance)),
-                equity=Decimal(str(account_info.equity)),
-                margin=Decimal(str(account_info.margin)),
-                free_margin=Decimal(str(account_info.margin_free)),
-                positions_count=mt5.positions_total(),
-                profit=Decimal(str(account_info.profit)),
+                balance=account_info.balance,
+                equity=account_info.equity,
+                margin=account_info.margin,
+                free_margin=account_info.margin_free,
+                positions_count=positions_count,
+                profit=account_info.profit,
                 leverage=account_info.leverage,
                 currency=account_info.currency,
                 name=account_info.name,
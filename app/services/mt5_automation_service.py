@@ -1,4 +1,6 @@
 import asyncio
+import heapq
+import itertools
 import logging
 from datetime import datetime, time
 from decimal import Decimal
@@ -15,18 +17,27 @@ logger = logging.getLogger(__name__)
 class MT5AutomationService:
     def __init__(self, base_service: MT5BaseService):
         self.base_service = base_service
-        self.scheduled_trades: List[ScheduledTrade] = []
+        # Min-heap of (execution_time, insertion_seq, trade): each tick pops
+        # only the trades that are due instead of scanning the whole list.
+        # The sequence number breaks ties so heapq never compares trades.
+        self.scheduled_trades: List[tuple] = []
+        self._sched_seq = itertools.count()
+        # Wakes the scheduler loop when a new trade may carry an earlier
+        # deadline than the one it is currently sleeping towards
+        self._sched_event = asyncio.Event()
         self.conditional_orders: List[ConditionalOrder] = []
         self.grid_configs: Dict[str, GridTradingConfig] = {}
+        # Invariant place_order kwargs per grid symbol, built once in
+        # setup_grid_trading; per-order dicts only add the varying
+        # price/side instead of re-reading the config for every level
+        self._grid_templates: Dict[str, Dict] = {}
         self.martingale_configs: Dict[str, MartingaleConfig] = {}
         self.running_tasks = []
 
     async def start_automation(self):
-        """Start all automation tasks"""
-        self.running_tasks.append(asyncio.create_task(self._schedule_monitor()))
-        self.running_tasks.append(asyncio.create_task(self._condition_monitor()))
-        self.running_tasks.append(asyncio.create_task(self._grid_monitor()))
-        self.running_tasks.append(asyncio.create_task(self._martingale_monitor()))
+        """Start the automation tick task and the trade scheduler"""
+        self.running_tasks.append(asyncio.create_task(self._tick_monitor()))
+        self.running_tasks.append(asyncio.create_task(self._schedule_loop()))
 
     async def stop_automation(self):
         """Stop all automation tasks"""
@@ -36,7 +47,11 @@ class MT5AutomationService:
 
     async def add_scheduled_trade(self, trade: ScheduledTrade) -> bool:
         """Add new scheduled trade"""
-        self.scheduled_trades.append(trade)
+        heapq.heappush(
+            self.scheduled_trades,
+            (trade.execution_time, next(self._sched_seq), trade)
+        )
+        self._sched_event.set()
         return True
 
     async def add_conditional_order(self, order: ConditionalOrder) -> bool:
@@ -47,6 +62,10 @@ class MT5AutomationService:
     async def setup_grid_trading(self, config: GridTradingConfig) -> bool:
         """Setup grid trading for symbol"""
         self.grid_configs[config.symbol] = config
+        self._grid_templates[config.symbol] = {
+            "symbol": config.symbol,
+            "volume": config.volume_per_level,
+        }
         await self._initialize_grid(config)
         return True
 
@@ -55,95 +74,184 @@ class MT5AutomationService:
         self.martingale_configs[config.symbol] = config
         return True
 
-    async def _schedule_monitor(self):
-        """Monitor and execute scheduled trades"""
-        while True:
-            try:
-                current_time = datetime.now().time()
-                for trade in self.scheduled_trades[:]:
-                    if self._should_execute_schedule(trade, current_time):
-                        await self._execute_trade(trade)
-                        if trade.schedule_type == "once":
-                            self.scheduled_trades.remove(trade)
-                await asyncio.sleep(1)
-            except Exception as e:
-                logger.error(f"Schedule monitor error: {str(e)}")
-                await asyncio.sleep(5)
+    async def _tick_monitor(self):
+        """
+        Single tick loop driving all four automation strategies.
 
-    async def _condition_monitor(self):
-        """Monitor and execute conditional orders"""
+        One task instead of four parallel while-loops means one wakeup per
+        second and one pass over the shared price cache per tick, so the
+        strategies no longer race each other for the MT5 worker with
+        duplicate fetches of the same symbols.
+        """
         while True:
-            try:
-                for order in self.conditional_orders[:]:
-                    if await self._check_conditions(order.conditions):
-                        await self._execute_trade(order)
-                        self.conditional_orders.remove(order)
-                await asyncio.sleep(1)
-            except Exception as e:
-                logger.error(f"Condition monitor error: {str(e)}")
-                await asyncio.sleep(5)
+            await self._run_conditions()
+            await self._run_grids()
+            await self._run_martingales()
+            await asyncio.sleep(1)
 
-    async def _grid_monitor(self):
-        """Monitor and manage grid trading"""
-        while True:
-            try:
-                for symbol, config in self.grid_configs.items():
-                    await self._manage_grid(config)
-                await asyncio.sleep(1)
-            except Exception as e:
-                logger.error(f"Grid monitor error: {str(e)}")
-                await asyncio.sleep(5)
+    async def _schedule_loop(self):
+        """
+        Deadline-driven scheduler for timed trades.
 
-    async def _martingale_monitor(self):
-        """Monitor and manage martingale strategies"""
+        Sleeps until the earliest execution_time on the heap instead of
+        polling every second, so triggers fire at their deadline rather
+        than up to a second late. add_scheduled_trade sets the event to
+        wake the loop when a new trade may carry an earlier deadline.
+        """
         while True:
             try:
-                for symbol, config in self.martingale_configs.items():
-                    await self._manage_martingale(config)
+                timeout = None
+                if self.scheduled_trades:
+                    now = datetime.now()
+                    target = datetime.combine(now.date(), self.scheduled_trades[0][0])
+                    timeout = max(0.0, (target - now).total_seconds())
+
+                if timeout != 0.0:
+                    # Sleep towards the deadline (or indefinitely when the
+                    # heap is empty), then recompute: the event may have
+                    # delivered an earlier deadline in the meantime
+                    try:
+                        await asyncio.wait_for(self._sched_event.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                    self._sched_event.clear()
+                    continue
+
+                await self._run_schedules()
+                # Recurring trades remain due for the rest of the day;
+                # pace their re-fires at the original 1s cadence
                 await asyncio.sleep(1)
             except Exception as e:
-                logger.error(f"Martingale monitor error: {str(e)}")
+                logger.error(f"Schedule loop error: {str(e)}")
                 await asyncio.sleep(5)
 
-    def _should_execute_schedule(self, trade: ScheduledTrade, current_time: time) -> bool:
-        """Check if scheduled trade should be executed"""
-        if trade.expiry_date and datetime.now() > trade.expiry_date:
-            return False
-        return trade.execution_time <= current_time
+    async def _run_schedules(self):
+        """Execute scheduled trades that are due this tick"""
+        try:
+            current_time = datetime.now().time()
+            requeue = []
+            # Only due entries are ever touched: O(log n) per pop instead
+            # of a full list scan plus O(n) remove every second
+            while self.scheduled_trades and self.scheduled_trades[0][0] <= current_time:
+                _, seq, trade = heapq.heappop(self.scheduled_trades)
+                if trade.expiry_date and datetime.now() > trade.expiry_date:
+                    continue
+                await self._execute_trade(trade)
+                if trade.schedule_type != "once":
+                    requeue.append((trade.execution_time, seq, trade))
+            for entry in requeue:
+                heapq.heappush(self.scheduled_trades, entry)
+        except Exception as e:
+            logger.error(f"Schedule monitor error: {str(e)}")
+
+    async def _run_conditions(self):
+        """Execute conditional orders whose conditions are met"""
+        try:
+            for order in self.conditional_orders[:]:
+                if await self._check_conditions(order.conditions):
+                    await self._execute_trade(order)
+                    self.conditional_orders.remove(order)
+        except Exception as e:
+            logger.error(f"Condition monitor error: {str(e)}")
+
+    async def _run_grids(self):
+        """Manage all active grid configurations concurrently"""
+        try:
+            await self._fan_out(self._manage_grid, self.grid_configs.values())
+        except Exception as e:
+            logger.error(f"Grid monitor error: {str(e)}")
+
+    async def _run_martingales(self):
+        """Manage all active martingale strategies concurrently"""
+        try:
+            await self._fan_out(self._manage_martingale, self.martingale_configs.values())
+        except Exception as e:
+            logger.error(f"Martingale monitor error: {str(e)}")
+
+    async def _fan_out(self, manage, configs):
+        """
+        Run a per-symbol manager over all configs concurrently.
+
+        Overlapping the waits collapses per-tick wall clock from N
+        sequential round-trips to roughly the slowest one; the semaphore
+        keeps a large symbol list from flooding the single MT5 worker.
+        """
+        configs = list(configs)
+        if not configs:
+            return
+        sem = asyncio.Semaphore(8)
+
+        async def one(config):
+            async with sem:
+                await manage(config)
+
+        await asyncio.gather(*(one(c) for c in configs))
 
     async def _check_conditions(self, conditions: List[Dict]) -> bool:
-        """Check if all conditions are met"""
-        for condition in conditions:
-            if not await self._evaluate_condition(condition):
-                return False
-        return True
+        """Check if all conditions are met, evaluating them concurrently"""
+        if not conditions:
+            return True
+        # Conditions referencing the same symbol/indicator share one fetch
+        # through this per-check memo instead of each hitting the terminal
+        memo: Dict[tuple, asyncio.Future] = {}
+        results = await asyncio.gather(
+            *(self._evaluate_condition(c, memo) for c in conditions)
+        )
+        return all(results)
+
+    def _memo_fetch(self, memo: Dict[tuple, asyncio.Future], key: tuple, factory):
+        """
+        Return the in-flight or completed fetch for key, starting it once.
 
-    async def _evaluate_condition(self, condition: Dict) -> bool:
+        Wrapping the coroutine in a future means concurrently evaluated
+        conditions awaiting the same key coalesce onto a single fetch.
+        """
+        fut = memo.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(factory())
+            memo[key] = fut
+        return fut
+
+    async def _evaluate_condition(self, condition: Dict, memo: Dict[tuple, asyncio.Future]) -> bool:
         """Evaluate single trading condition"""
         condition_type = condition.get('type')
         symbol = condition.get('symbol')
         value = condition.get('value')
 
         if condition_type == 'price_above':
-            current_price = await self.base_service.get_current_price(symbol)
+            current_price = await self._memo_fetch(
+                memo, ('price', symbol),
+                lambda: self.base_service.get_current_price(symbol))
             return current_price > Decimal(str(value))
-        
+
         elif condition_type == 'price_below':
-            current_price = await self.base_service.get_current_price(symbol)
+            current_price = await self._memo_fetch(
+                memo, ('price', symbol),
+                lambda: self.base_service.get_current_price(symbol))
             return current_price < Decimal(str(value))
-        
+
         elif condition_type == 'ma_crossover':
             # Check MA crossover condition
-            fast_ma = await self.base_service.get_ma(symbol, condition['fast_period'])
-            slow_ma = await self.base_service.get_ma(symbol, condition['slow_period'])
+            fast_period = condition['fast_period']
+            slow_period = condition['slow_period']
+            fast_ma = await self._memo_fetch(
+                memo, ('ma', symbol, fast_period),
+                lambda: self.base_service.get_ma(symbol, fast_period))
+            slow_ma = await self._memo_fetch(
+                memo, ('ma', symbol, slow_period),
+                lambda: self.base_service.get_ma(symbol, slow_period))
             return fast_ma[-1] > slow_ma[-1] and fast_ma[-2] < slow_ma[-2]
-        
+
         elif condition_type == 'rsi_above':
-            rsi = await self.base_service.get_rsi(symbol, 14)
+            rsi = await self._memo_fetch(
+                memo, ('rsi', symbol, 14),
+                lambda: self.base_service.get_rsi(symbol, 14))
             return rsi[-1] > value
-        
+
         elif condition_type == 'rsi_below':
-            rsi = await self.base_service.get_rsi(symbol, 14)
+            rsi = await self._memo_fetch(
+                memo, ('rsi', symbol, 14),
+                lambda: self.base_service.get_rsi(symbol, 14))
             return rsi[-1] < value
 
         return False
@@ -187,28 +295,33 @@ class MT5AutomationService:
             current_price = await self.base_service.get_current_price(config.symbol)
             grid_size = config.grid_size
             price_distance = config.price_distance
+            tp_distance = config.take_profit_distance
+            template = self._grid_templates[config.symbol]
 
-            # Create buy orders grid below current price
+            # Build every placement up front and fire them together: grid
+            # init cost drops from 2*grid_size serial round-trips to
+            # roughly one burst through the MT5 worker
+            placements = []
             for i in range(1, grid_size + 1):
                 buy_price = current_price - (price_distance * i)
-                await self.base_service.place_order(
-                    symbol=config.symbol,
+                placements.append(self.base_service.place_order(
+                    **template,
                     order_type="BUY_LIMIT",
-                    volume=config.volume_per_grid,
                     price=buy_price,
-                    take_profit=buy_price + config.take_profit_distance
-                )
-
-            # Create sell orders grid above current price
-            for i in range(1, grid_size + 1):
+                    take_profit=buy_price + tp_distance
+                ))
                 sell_price = current_price + (price_distance * i)
-                await self.base_service.place_order(
-                    symbol=config.symbol,
+                placements.append(self.base_service.place_order(
+                    **template,
                     order_type="SELL_LIMIT",
-                    volume=config.volume_per_grid,
                     price=sell_price,
-                    take_profit=sell_price - config.take_profit_distance
-                )
+                    take_profit=sell_price - tp_distance
+                ))
+
+            results = await asyncio.gather(*placements, return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    logger.error(f"Grid order placement failed: {str(result)}")
 
         except Exception as e:
             logger.error(f"Error initializing grid: {str(e)}")
@@ -222,39 +335,55 @@ class MT5AutomationService:
 
             # Check and replace executed grid orders
             current_price = await self.base_service.get_current_price(config.symbol)
-            
-            # Calculate required grid orders on each side
-            required_buys = sum(1 for order in pending_orders 
-                              if order.type == "BUY_LIMIT")
-            required_sells = sum(1 for order in pending_orders 
-                               if order.type == "SELL_LIMIT")
 
-            # Add new orders if needed
+            # One pass over pending_orders computes both side counts and
+            # both price extremes, instead of two sum() generators plus
+            # min()/max() walking the list four times
+            required_buys = required_sells = 0
+            lowest_buy = highest_sell = None
+            for order in pending_orders:
+                if order.type == "BUY_LIMIT":
+                    required_buys += 1
+                    if lowest_buy is None or order.price < lowest_buy:
+                        lowest_buy = order.price
+                elif order.type == "SELL_LIMIT":
+                    required_sells += 1
+                    if highest_sell is None or order.price > highest_sell:
+                        highest_sell = order.price
+            if lowest_buy is None:
+                lowest_buy = current_price
+            if highest_sell is None:
+                highest_sell = current_price
+
+            # Add new orders if needed; the replacement buy and sell are
+            # independent, so place them in one concurrent burst
+            placements = []
+            template = self._grid_templates[config.symbol]
             if required_buys < config.grid_size:
-                lowest_buy = min((order.price for order in pending_orders 
-                                if order.type == "BUY_LIMIT"), default=current_price)
                 new_buy_price = lowest_buy - config.price_distance
-                
-                await self.base_service.place_order(
-                    symbol=config.symbol,
+
+                placements.append(self.base_service.place_order(
+                    **template,
                     order_type="BUY_LIMIT",
-                    volume=config.volume_per_grid,
                     price=new_buy_price,
                     take_profit=new_buy_price + config.take_profit_distance
-                )
+                ))
 
             if required_sells < config.grid_size:
-                highest_sell = max((order.price for order in pending_orders 
-                                  if order.type == "SELL_LIMIT"), default=current_price)
                 new_sell_price = highest_sell + config.price_distance
-                
-                await self.base_service.place_order(
-                    symbol=config.symbol,
+
+                placements.append(self.base_service.place_order(
+                    **template,
                     order_type="SELL_LIMIT",
-                    volume=config.volume_per_grid,
                     price=new_sell_price,
                     take_profit=new_sell_price - config.take_profit_distance
-                )
+                ))
+
+            if placements:
+                results = await asyncio.gather(*placements, return_exceptions=True)
+                for result in results:
+                    if isinstance(result, BaseException):
+                        logger.error(f"Grid order placement failed: {str(result)}")
 
         except Exception as e:
             logger.error(f"Error managing grid: {str(e)}")
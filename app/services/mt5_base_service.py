@@ -1,3 +1,10 @@
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from typing import Dict, Optional, Tuple
 import MetaTrader5 as mt5
 import logging
 
@@ -12,28 +19,133 @@ class MT5BaseService:
     """
     _instance = None
     _initialized = False
+    # Constructed (attributes set up) is distinct from initialized
+    # (connected to the terminal): _initialized only flips in connect(),
+    # so it must not guard __init__
+    _constructed = False
+    _lock = threading.Lock()
+
+    # How long a cached tick quote stays servable, in seconds
+    PRICE_CACHE_TTL = 0.25
+    # How long a successful liveness probe vouches for the connection
+    CONNECTED_TTL = 1.0
 
     def __new__(cls):
+        # Double-checked locking: without it two threads constructing the
+        # service concurrently can each create an instance, leaking an MT5
+        # terminal handle
         if cls._instance is None:
-            cls._instance = super(MT5BaseService, cls).__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(MT5BaseService, cls).__new__(cls)
         return cls._instance
 
     def __init__(self):
         """
         Initialize base service with reconnection settings.
-        Skips if already initialized (singleton pattern).
+        Skips if already constructed (singleton pattern).
         """
-        if self._initialized:
+        if self._constructed:
             return
-            
+        self._constructed = True
+
+
         self.reconnect_attempts = 3
         self.reconnect_delay = 5
-        
+        # Credentials from the last successful connect(), used by
+        # ensure_connected to re-login after the terminal drops
+        self._login_info = None
+        # Monotonic time of the last successful liveness probe; within
+        # CONNECTED_TTL ensure_connected answers without touching the
+        # terminal, like a pool's connection liveness check
+        self._last_ok = 0.0
+        # Single-flights the reconnect backoff loop: one coroutine runs
+        # it while concurrent callers wait and re-check instead of each
+        # sleeping out the full backoff with duplicate login rounds
+        self._reconnect_lock = asyncio.Lock()
+        # The MetaTrader5 API is synchronous and not thread-safe, so all
+        # terminal calls are funnelled through this single worker thread
+        # instead of blocking the event loop (see call()).
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mt5")
+        # Identical read calls that are already in flight share one result
+        # instead of queueing duplicate terminal round-trips (see call_shared()).
+        self._inflight = {}
+        # Per-symbol tick quotes, valid for PRICE_CACHE_TTL seconds. The
+        # automation monitors re-read the same prices every tick; a micro
+        # TTL drops most of those symbol_info_tick round-trips without
+        # serving quotes stale enough to matter for order placement.
+        self._price_cache: Dict[str, Tuple[float, Decimal]] = {}
+
     @property
     def initialized(self):
         """Check if MT5 connection is initialized"""
         return self._initialized
-        
+
+    async def call(self, fn, *args, **kwargs):
+        """
+        Run a blocking MetaTrader5 function on the dedicated MT5 thread.
+
+        Parameters:
+        - fn: MetaTrader5 function to execute (e.g. mt5.order_send)
+        - args/kwargs: Arguments forwarded to the function
+
+        Returns:
+        - The function's return value, once the worker thread completes
+        """
+        loop = asyncio.get_running_loop()
+        if kwargs:
+            fn = functools.partial(fn, *args, **kwargs)
+            return await loop.run_in_executor(self._executor, fn)
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    async def call_shared(self, fn, *args, **kwargs):
+        """
+        Like call(), but coalesces identical concurrent calls.
+
+        Read-only lookups (positions, symbol info, account info) are often
+        requested by several handlers at once; callers arriving while the
+        same call is still in flight await the existing result instead of
+        queueing another terminal round-trip. Only use for idempotent reads,
+        never for order_send or other state-changing calls.
+        """
+        key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.call(fn, *args, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t, _k=key: self._inflight.pop(_k, None))
+        # Shield so one cancelled waiter does not cancel the shared call
+        return await asyncio.shield(task)
+
+    async def get_current_price(self, symbol: str) -> Optional[Decimal]:
+        """
+        Get the current bid price for a symbol, cached for a fraction of
+        a second.
+
+        Within one cache window every monitor loop and condition check
+        shares a single symbol_info_tick round-trip; misses still
+        coalesce through call_shared.
+
+        Parameters:
+        - symbol: Trading symbol (e.g. "EURUSD")
+
+        Returns:
+        - Decimal: Current bid price
+        - None: If no tick is available for the symbol
+        """
+        now = time.monotonic()
+        cached = self._price_cache.get(symbol)
+        if cached is not None and now - cached[0] < self.PRICE_CACHE_TTL:
+            return cached[1]
+
+        tick = await self.call_shared(mt5.symbol_info_tick, symbol)
+        if tick is None:
+            return None
+
+        price = Decimal(str(tick.bid))
+        self._price_cache[symbol] = (time.monotonic(), price)
+        return price
+
     async def connect(self, login: int, password: str, server: str) -> bool:
         """
         Connect to MT5 terminal with credentials.
@@ -46,26 +158,60 @@ class MT5BaseService:
         Returns:
         - bool: True if connection successful, False otherwise
         """
-        if not mt5.initialize():
+        if not await self.call(mt5.initialize):
             return False
-            
-        if not mt5.login(login=login, password=password, server=server):
-            mt5.shutdown()
+
+        if not await self.call(mt5.login, login=login, password=password, server=server):
+            await self.call(mt5.shutdown)
             return False
-            
+
+        # Kept so ensure_connected can re-login automatically after the
+        # terminal drops the session
+        self._login_info = (login, password, server)
         self._initialized = True
+        self._last_ok = time.monotonic()
         return True
 
     async def ensure_connected(self) -> bool:
         """
-        Verify MT5 connection is active.
-        
+        Verify MT5 connection is active, reconnecting if it dropped.
+
+        A live terminal costs one terminal_info probe. If the terminal has
+        gone away (restart, network loss), retry connect() with the stored
+        credentials under exponential backoff instead of failing every
+        downstream call until the process is restarted.
+
         Returns:
-        - bool: True if connected, False otherwise
+        - bool: True if connected (possibly after reconnecting), False otherwise
         """
         if not self._initialized:
             return False
-        return mt5.terminal_info() is not None
+        if time.monotonic() - self._last_ok < self.CONNECTED_TTL:
+            return True
+        if await self.call(mt5.terminal_info) is not None:
+            self._last_ok = time.monotonic()
+            return True
+
+        if self._login_info is None:
+            return False
+
+        async with self._reconnect_lock:
+            # Another coroutine may have restored the session while this
+            # one waited for the lock
+            if self._initialized and time.monotonic() - self._last_ok < self.CONNECTED_TTL:
+                return True
+
+            logger.warning("MT5 terminal connection lost, attempting reconnect")
+            self._initialized = False
+            for attempt in range(self.reconnect_attempts):
+                await asyncio.sleep(self.reconnect_delay * (2 ** attempt))
+                try:
+                    if await self.connect(*self._login_info):
+                        logger.info("MT5 reconnected after %d attempt(s)", attempt + 1)
+                        return True
+                except Exception as e:
+                    logger.error(f"MT5 reconnect attempt failed: {str(e)}")
+            return False
 
     async def shutdown(self):
         """
@@ -73,7 +219,7 @@ class MT5BaseService:
         Logs connection closure for monitoring.
         """
         if self._initialized:
-            mt5.shutdown()
+            await self.call(mt5.shutdown)
             self._initialized = False
             logger.info("MT5 connection closed")
 
@@ -83,4 +229,9 @@ class MT5BaseService:
         Ensures MT5 connection is properly closed.
         """
         if self._initialized:
-            mt5.shutdown() 
\ No newline at end of file
+            # During interpreter teardown the mt5 module may already be
+            # partially finalized; never let that surface as an error
+            try:
+                mt5.shutdown()
+            except Exception:
+                pass 
\ No newline at end of file
@@ -1,7 +1,7 @@
 from typing import List, Optional
-from decimal import Decimal
 from datetime import datetime
 import MetaTrader5 as mt5
+import pandas as pd
 import logging
 from .mt5_base_service import MT5BaseService
 from ..models.trade import HistoricalOrder, HistoricalDeal, HistoricalPosition
@@ -52,19 +52,28 @@ class MT5HistoryService:
         if not await self.base_service.ensure_connected():
             return []
         try:
-            orders = mt5.history_orders_get(start_date, end_date)
+            orders = await self.base_service.call(mt5.history_orders_get, start_date, end_date)
+            if not orders:
+                return []
+            # Terminal rows are trusted; model_construct skips per-field
+            # validation on these potentially large lists. Locals keep the
+            # constructor, timestamp converter and buy constant out of the
+            # per-row attribute lookups
+            construct = HistoricalOrder.model_construct
+            fromts = datetime.fromtimestamp
+            buy_type = mt5.ORDER_TYPE_BUY
             return [
-                HistoricalOrder(
+                construct(
                     ticket=order.ticket,
                     symbol=order.symbol,
-                    type="buy" if order.type == mt5.ORDER_TYPE_BUY else "sell",
-                    volume=Decimal(str(order.volume_current)),
-                    price=Decimal(str(order.price_open)),
-                    time=datetime.fromtimestamp(order.time_setup),
+                    type="buy" if order.type == buy_type else "sell",
+                    volume=order.volume_current,
+                    price=order.price_open,
+                    time=fromts(order.time_setup),
                     state=order.state,
-                    profit=Decimal(str(order.profit)) if hasattr(order, 'profit') and order.profit is not None else None
+                    profit=order.profit if hasattr(order, 'profit') and order.profit is not None else None
                 ) for order in orders
-            ] if orders else []
+            ]
         except Exception as e:
             logger.error(f"Error getting history orders: {str(e)}")
             return []
@@ -97,23 +106,155 @@ class MT5HistoryService:
         if not await self.base_service.ensure_connected():
             return []
         try:
-            deals = mt5.history_deals_get(start_date, end_date)
+            deals = await self.base_service.call(mt5.history_deals_get, start_date, end_date)
+            if not deals:
+                return []
+            construct = HistoricalDeal.model_construct
+            fromts = datetime.fromtimestamp
+            buy_type = mt5.ORDER_TYPE_BUY
             return [
-                HistoricalDeal(
+                construct(
                     ticket=deal.ticket,
                     order_ticket=deal.order,
                     symbol=deal.symbol,
-                    type="buy" if deal.type == mt5.ORDER_TYPE_BUY else "sell",
-                    volume=Decimal(str(deal.volume)),
-                    price=Decimal(str(deal.price)),
-                    time=datetime.fromtimestamp(deal.time),
-                    profit=Decimal(str(deal.profit))
+                    type="buy" if deal.type == buy_type else "sell",
+                    volume=deal.volume,
+                    price=deal.price,
+                    time=fromts(deal.time),
+                    profit=deal.profit
                 ) for deal in deals
-            ] if deals else []
+            ]
         except Exception as e:
             logger.error(f"Error getting history deals: {str(e)}")
             return []
 
+    async def iter_deals(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ):
+        """
+        Yield historical deals one at a time for streaming responses.
+
+        Parameters:
+        - start_date: Starting date for history query (optional)
+        - end_date: Ending date for history query (optional)
+
+        Yields:
+        - dict per deal with the same fields as HistoricalDeal, as plain
+          floats ready for line-by-line JSON serialization
+
+        Note: Fetching stays on the MT5 worker thread; yielding row by row
+        avoids materializing the full model list for large ranges
+        """
+        if not await self.base_service.ensure_connected():
+            return
+        deals = await self.base_service.call(mt5.history_deals_get, start_date, end_date)
+        if not deals:
+            return
+        # Locals instead of module attribute lookups inside the row loop
+        fromts = datetime.fromtimestamp
+        buy_type = mt5.ORDER_TYPE_BUY
+        for deal in deals:
+            yield {
+                "ticket": deal.ticket,
+                "order_ticket": deal.order,
+                "symbol": deal.symbol,
+                "type": "buy" if deal.type == buy_type else "sell",
+                "volume": deal.volume,
+                "price": deal.price,
+                "time": fromts(deal.time),
+                "profit": deal.profit
+            }
+
+    async def iter_orders(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ):
+        """
+        Yield historical orders one at a time for streaming responses.
+
+        Parameters:
+        - start_date: Starting date for history query (optional)
+        - end_date: Ending date for history query (optional)
+
+        Yields:
+        - dict per order with the same fields as HistoricalOrder
+        """
+        if not await self.base_service.ensure_connected():
+            return
+        orders = await self.base_service.call(mt5.history_orders_get, start_date, end_date)
+        if not orders:
+            return
+        fromts = datetime.fromtimestamp
+        buy_type = mt5.ORDER_TYPE_BUY
+        for order in orders:
+            yield {
+                "ticket": order.ticket,
+                "symbol": order.symbol,
+                "type": "buy" if order.type == buy_type else "sell",
+                "volume": order.volume_current,
+                "price": order.price_open,
+                "time": fromts(order.time_setup),
+                "state": order.state,
+                "profit": order.profit if hasattr(order, 'profit') and order.profit is not None else None
+            }
+
+    async def iter_positions(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ):
+        """
+        Yield reconstructed closed positions one at a time for streaming.
+
+        Parameters:
+        - start_date: Starting date for history query (optional)
+        - end_date: Ending date for history query (optional)
+
+        Yields:
+        - dict per closed position with the same fields as HistoricalPosition
+
+        Note: Positions are rebuilt from deals, so the open/close pairing
+        dict is still held in memory; only the response rows stream
+        """
+        if not await self.base_service.ensure_connected():
+            return
+        deals = await self.base_service.call(mt5.history_deals_get, start_date, end_date)
+        if not deals:
+            return
+
+        positions = {}
+        fromts = datetime.fromtimestamp
+        buy_type = mt5.ORDER_TYPE_BUY
+        entry_in = mt5.DEAL_ENTRY_IN
+        entry_out = mt5.DEAL_ENTRY_OUT
+        for deal in deals:
+            if deal.entry == entry_in:
+                positions[deal.position_id] = {
+                    "ticket": deal.position_id,
+                    "symbol": deal.symbol,
+                    "type": "buy" if deal.type == buy_type else "sell",
+                    "volume": deal.volume,
+                    "open_price": deal.price,
+                    "open_time": fromts(deal.time),
+                    "close_price": None,
+                    "close_time": None,
+                    "profit": 0.0
+                }
+            elif deal.entry == entry_out:
+                if deal.position_id in positions:
+                    positions[deal.position_id].update({
+                        "close_price": deal.price,
+                        "close_time": fromts(deal.time),
+                        "profit": deal.profit
+                    })
+
+        for pos in positions.values():
+            if pos["close_time"] is not None:
+                yield pos
+
     async def get_history_positions(
         self,
         start_date: Optional[datetime] = None,
@@ -147,36 +288,48 @@ class MT5HistoryService:
             return []
         try:
             # Get closed positions through deals
-            deals = mt5.history_deals_get(start_date, end_date)
+            deals = await self.base_service.call(mt5.history_deals_get, start_date, end_date)
             if not deals:
                 return []
 
-            positions = {}
-            for deal in deals:
-                if deal.entry == mt5.DEAL_ENTRY_IN:  # Position open
-                    positions[deal.position_id] = {
-                        "ticket": deal.position_id,
-                        "symbol": deal.symbol,
-                        "type": "buy" if deal.type == mt5.ORDER_TYPE_BUY else "sell",
-                        "volume": Decimal(str(deal.volume)),
-                        "open_price": Decimal(str(deal.price)),
-                        "open_time": datetime.fromtimestamp(deal.time),
-                        "close_price": None,
-                        "close_time": None,
-                        "profit": Decimal("0")
-                    }
-                elif deal.entry == mt5.DEAL_ENTRY_OUT:  # Position close
-                    if deal.position_id in positions:
-                        positions[deal.position_id].update({
-                            "close_price": Decimal(str(deal.price)),
-                            "close_time": datetime.fromtimestamp(deal.time),
-                            "profit": Decimal(str(deal.profit))
-                        })
+            # Column-oriented rebuild: split the deal stream into open and
+            # close legs and pair them with one indexed join on
+            # position_id, instead of per-deal dict churn in Python
+            df = pd.DataFrame(list(deals), columns=deals[0]._asdict().keys())
+            opens = df[df["entry"] == mt5.DEAL_ENTRY_IN].drop_duplicates(
+                "position_id", keep="last")
+            closes = df[df["entry"] == mt5.DEAL_ENTRY_OUT].drop_duplicates(
+                "position_id", keep="last")
+            # Inner join keeps only fully closed positions
+            merged = opens.merge(
+                closes[["position_id", "price", "time", "profit"]],
+                on="position_id", suffixes=("", "_close")
+            )
+            if merged.empty:
+                return []
 
+            # fromtimestamp keeps the naive-local-time convention of the
+            # other history endpoints (pd.to_datetime would be naive UTC)
+            fromts = datetime.fromtimestamp
+            open_times = [fromts(t) for t in merged["time"].tolist()]
+            close_times = [fromts(t) for t in merged["time_close"].tolist()]
+            buy_type = mt5.ORDER_TYPE_BUY
+            construct = HistoricalPosition.model_construct
             return [
-                HistoricalPosition(**pos)
-                for pos in positions.values()
-                if pos["close_time"] is not None
+                construct(
+                    ticket=row.position_id,
+                    symbol=row.symbol,
+                    type="buy" if row.type == buy_type else "sell",
+                    volume=row.volume,
+                    open_price=row.price,
+                    open_time=open_time,
+                    close_price=row.price_close,
+                    close_time=close_time,
+                    profit=row.profit_close
+                )
+                for row, open_time, close_time in zip(
+                    merged.itertuples(index=False), open_times, close_times
+                )
             ]
         except Exception as e:
             logger.error(f"Error getting position history: {str(e)}")
@@ -1,13 +1,25 @@
+import asyncio
 from typing import List, Optional, Dict
-from decimal import Decimal
 from datetime import datetime
 import MetaTrader5 as mt5
 import logging
 from .mt5_base_service import MT5BaseService
 from ..models.market import SymbolInfo, TickData, OHLC
+from ..utils.ttl_cache import ttl_cache
 
 logger = logging.getLogger(__name__)
 
+# Built once at import; every OHLC call was rebuilding this dict
+_TIMEFRAME_MAP = {
+    "M1": mt5.TIMEFRAME_M1,
+    "M5": mt5.TIMEFRAME_M5,
+    "M15": mt5.TIMEFRAME_M15,
+    "M30": mt5.TIMEFRAME_M30,
+    "H1": mt5.TIMEFRAME_H1,
+    "H4": mt5.TIMEFRAME_H4,
+    "D1": mt5.TIMEFRAME_D1,
+}
+
 class MT5MarketService:
     """
     Service for handling market data operations in MT5.
@@ -23,6 +35,7 @@ class MT5MarketService:
         """
         self.base_service = base_service
 
+    @ttl_cache(ttl=2.0)
     async def get_symbol_info(self, symbol: str) -> Optional[SymbolInfo]:
         """
         Get detailed information about a specific symbol.
@@ -42,32 +55,34 @@ class MT5MarketService:
         if not await self.base_service.ensure_connected():
             return None
         try:
-            info = mt5.symbol_info(symbol)
+            # call_shared: concurrent misses for the same symbol share one
+            # terminal round-trip while the TTL entry rebuilds
+            info = await self.base_service.call_shared(mt5.symbol_info, symbol)
             if info is None:
                 return None
             return SymbolInfo(
                 name=info.name,
-                bid=Decimal(str(info.bid)),
-                ask=Decimal(str(info.ask)),
+                bid=info.bid,
+                ask=info.ask,
                 spread=info.spread,
                 digits=info.digits,
                 trade_mode=info.trade_mode,
                 trade_allowed=info.trade_allowed,
-                volume_min=Decimal(str(info.volume_min)),
-                volume_max=Decimal(str(info.volume_max)),
-                volume_step=Decimal(str(info.volume_step))
+                volume_min=info.volume_min,
+                volume_max=info.volume_max,
+                volume_step=info.volume_step
             )
         except Exception as e:
             logger.error(f"Error getting symbol info: {str(e)}")
             return None
 
-    async def get_symbol_price(self, symbol: str) -> Optional[Dict[str, Decimal]]:
+    async def get_symbol_price(self, symbol: str) -> Optional[Dict[str, float]]:
         """
         Get current price information for a symbol.
-        
+
         Parameters:
         - symbol: Symbol name to get price for
-        
+
         Returns:
         - Dict with price information:
             - bid: Current bid price
@@ -78,18 +93,52 @@ class MT5MarketService:
         if not await self.base_service.ensure_connected():
             return None
         try:
-            tick = mt5.symbol_info_tick(symbol)
+            # call_shared: when the request rate outruns the tick rate,
+            # simultaneous callers for the same symbol collapse onto one
+            # in-flight terminal read instead of queueing duplicates
+            tick = await self.base_service.call_shared(mt5.symbol_info_tick, symbol)
             if tick is None:
                 return None
-            return {
-                "bid": Decimal(str(tick.bid)),
-                "ask": Decimal(str(tick.ask)),
-                "last": Decimal(str(tick.last))
-            }
+            # Raw floats, matching get_symbol_prices: the terminal hands us
+            # doubles and the response serializes them straight back, so
+            # the old Decimal(str(...)) per field was pure overhead
+            return {"bid": tick.bid, "ask": tick.ask, "last": tick.last}
         except Exception as e:
             logger.error(f"Error getting symbol price: {str(e)}")
             return None
 
+    async def get_symbol_prices(self, symbols: List[str]) -> Dict[str, Dict[str, float]]:
+        """
+        Get current prices for several symbols in one call.
+
+        Parameters:
+        - symbols: Symbol names to get prices for
+
+        Returns:
+        - Dict keyed by symbol with bid/ask/last floats; symbols with no
+          available tick are omitted
+
+        Note: All ticks are fetched in a single hop to the MT5 worker
+        thread, so a dashboard batch costs one executor round trip
+        instead of one per symbol
+        """
+        if not await self.base_service.ensure_connected():
+            return {}
+
+        def fetch(names):
+            result = {}
+            for name in names:
+                tick = mt5.symbol_info_tick(name)
+                if tick is not None:
+                    result[name] = {"bid": tick.bid, "ask": tick.ask, "last": tick.last}
+            return result
+
+        try:
+            return await self.base_service.call(fetch, symbols)
+        except Exception as e:
+            logger.error(f"Error getting symbol prices: {str(e)}")
+            return {}
+
     async def get_symbol_ticks(self, symbol: str, count: int) -> List[TickData]:
         """
         Get historical tick data for a symbol.
@@ -109,16 +158,30 @@ class MT5MarketService:
         if not await self.base_service.ensure_connected():
             return []
         try:
-            ticks = mt5.copy_ticks_from(symbol, datetime.now(), count, mt5.COPY_TICKS_ALL)
+            ticks = await self.base_service.call(
+                mt5.copy_ticks_from, symbol, datetime.now(), count, mt5.COPY_TICKS_ALL
+            )
+            if ticks is None or len(ticks) == 0:
+                return []
+            # Column-wise extraction from the structured ndarray: one
+            # pass per field instead of indexing every row from Python.
+            # fromtimestamp keeps the naive-local-time convention the
+            # history endpoints use (datetime64 casts would be naive UTC).
+            # MT5 rows are trusted native types; model_construct skips the
+            # per-row pydantic validation pass on these bulk responses
+            fromts = datetime.fromtimestamp
+            times = [fromts(t) for t in ticks['time'].tolist()]
+            construct = TickData.model_construct
             return [
-                TickData(
-                    time=datetime.fromtimestamp(tick[0]),
-                    bid=Decimal(str(tick[1])),
-                    ask=Decimal(str(tick[2])),
-                    last=Decimal(str(tick[3])),
-                    volume=Decimal(str(tick[4]))
-                ) for tick in ticks
-            ] if ticks is not None else []
+                construct(time=t, bid=b, ask=a, last=l, volume=v)
+                for t, b, a, l, v in zip(
+                    times,
+                    ticks['bid'].tolist(),
+                    ticks['ask'].tolist(),
+                    ticks['last'].tolist(),
+                    ticks['volume'].tolist()
+                )
+            ]
         except Exception as e:
             logger.error(f"Error getting symbol ticks: {str(e)}")
             return []
@@ -144,78 +207,191 @@ class MT5MarketService:
         if not await self.base_service.ensure_connected():
             return []
         try:
-            timeframe_map = {
-                "M1": mt5.TIMEFRAME_M1,
-                "M5": mt5.TIMEFRAME_M5,
-                "M15": mt5.TIMEFRAME_M15,
-                "M30": mt5.TIMEFRAME_M30,
-                "H1": mt5.TIMEFRAME_H1,
-                "H4": mt5.TIMEFRAME_H4,
-                "D1": mt5.TIMEFRAME_D1,
-            }
-            tf = timeframe_map.get(timeframe, mt5.TIMEFRAME_M1)
-            rates = mt5.copy_rates_from_pos(symbol, tf, 0, count)
+            # Unknown timeframes return empty instead of silently falling
+            # back to M1, which masked client typos with a wasted fetch
+            tf = _TIMEFRAME_MAP.get(timeframe)
+            if tf is None:
+                return []
+            rates = await self.base_service.call(mt5.copy_rates_from_pos, symbol, tf, 0, count)
+            if rates is None or len(rates) == 0:
+                return []
+            # Column-wise extraction, same as get_symbol_ticks; fromtimestamp
+            # for the same naive-local-time consistency
+            fromts = datetime.fromtimestamp
+            times = [fromts(t) for t in rates['time'].tolist()]
+            construct = OHLC.model_construct
             return [
-                OHLC(
-                    time=datetime.fromtimestamp(rate[0]),
-                    open=Decimal(str(rate[1])),
-                    high=Decimal(str(rate[2])),
-                    low=Decimal(str(rate[3])),
-                    close=Decimal(str(rate[4])),
-                    volume=Decimal(str(rate[5]))
-                ) for rate in rates
-            ] if rates is not None else []
+                construct(time=t, open=o, high=h, low=l, close=c, volume=v)
+                for t, o, h, l, c, v in zip(
+                    times,
+                    rates['open'].tolist(),
+                    rates['high'].tolist(),
+                    rates['low'].tolist(),
+                    rates['close'].tolist(),
+                    rates['tick_volume'].tolist()
+                )
+            ]
         except Exception as e:
             logger.error(f"Error getting OHLC data: {str(e)}")
             return []
 
-    async def search_symbols(self, query: str = None) -> List[Dict]:
+    async def get_many_ohlc(
+        self, symbols: List[str], timeframe: str, count: int
+    ) -> Dict[str, List[OHLC]]:
         """
-        Search and get available trading symbols with pricing information
+        Get OHLC data for several symbols concurrently.
+
+        Dashboard-style fan-outs overlap their terminal round-trips and
+        row conversion instead of paying symbols x RTT sequentially; the
+        semaphore keeps a large symbol list from flooding the MT5 worker.
+
+        Parameters:
+        - symbols: Symbol names to fetch candles for
+        - timeframe: Time period (M1, M5, M15, M30, H1, H4, D1)
+        - count: Number of candles per symbol
+
+        Returns:
+        - Dict keyed by symbol with that symbol's OHLC list (empty on error)
+        """
+        sem = asyncio.Semaphore(8)
+
+        async def one(name):
+            async with sem:
+                return name, await self.get_symbol_ohlc(name, timeframe, count)
+
+        results = await asyncio.gather(*(one(s) for s in symbols))
+        return dict(results)
+
+    async def iter_symbol_ticks(self, symbol: str, count: int):
+        """
+        Yield tick rows one at a time for streaming responses.
+
+        Parameters:
+        - symbol: Symbol name to get ticks for
+        - count: Number of ticks to retrieve
+
+        Yields:
+        - dict per tick with the same fields as TickData
+        """
+        if not await self.base_service.ensure_connected():
+            return
+        ticks = await self.base_service.call(
+            mt5.copy_ticks_from, symbol, datetime.now(), count, mt5.COPY_TICKS_ALL
+        )
+        if ticks is None or len(ticks) == 0:
+            return
+        fromts = datetime.fromtimestamp
+        times = [fromts(t) for t in ticks['time'].tolist()]
+        for t, b, a, l, v in zip(
+            times,
+            ticks['bid'].tolist(),
+            ticks['ask'].tolist(),
+            ticks['last'].tolist(),
+            ticks['volume'].tolist()
+        ):
+            yield {"time": t, "bid": b, "ask": a, "last": l, "volume": v}
+
+    async def iter_symbol_ohlc(self, symbol: str, timeframe: str, count: int):
+        """
+        Yield OHLC bars one at a time for streaming responses.
+
+        Parameters:
+        - symbol: Symbol name to get candles for
+        - timeframe: Time period (M1, M5, M15, M30, H1, H4, D1)
+        - count: Number of candles to retrieve
+
+        Yields:
+        - dict per bar with the same fields as OHLC, ready for
+          line-by-line JSON serialization
+        """
+        if not await self.base_service.ensure_connected():
+            return
+        tf = _TIMEFRAME_MAP.get(timeframe)
+        if tf is None:
+            return
+        rates = await self.base_service.call(mt5.copy_rates_from_pos, symbol, tf, 0, count)
+        if rates is None or len(rates) == 0:
+            return
+        fromts = datetime.fromtimestamp
+        times = [fromts(t) for t in rates['time'].tolist()]
+        for t, o, h, l, c, v in zip(
+            times,
+            rates['open'].tolist(),
+            rates['high'].tolist(),
+            rates['low'].tolist(),
+            rates['close'].tolist(),
+            rates['tick_volume'].tolist()
+        ):
+            yield {"time": t, "open": o, "high": h, "low": l, "close": c, "volume": v}
+
+    @ttl_cache(ttl=5.0)
+    async def _get_symbol_catalogue(self) -> List[tuple]:
+        """
+        Build the full symbol catalogue as (searchable, info) pairs.
+
+        searchable is the casefolded "name description" string, precomputed
+        once per rebuild so per-query filtering is a plain substring scan.
+        The catalogue is shared by all queries within the TTL, so 'btc',
+        'usd' and 'gold' searches in the same window pay one MT5 scan total.
         """
-        symbols = mt5.symbols_get()
-        if symbols is None:
+        # The whole scan — symbols_get plus one tick per symbol — runs as
+        # a single hop on the MT5 worker thread; per-symbol executor round
+        # trips would dwarf the terminal IPC itself
+        def build():
+            symbols = mt5.symbols_get()
+            if symbols is None:
+                return None
+
+            catalogue = []
+            for symbol in symbols:
+                # Get current price info
+                tick = mt5.symbol_info_tick(symbol.name)
+                if tick is None:
+                    continue
+
+                # Calculate minimum amount in USD
+                min_amount = symbol.volume_min * symbol.trade_contract_size * tick.ask
+                amount_step = symbol.volume_step * symbol.trade_contract_size * tick.ask
+
+                symbol_info = {
+                    "name": symbol.name,
+                    "description": symbol.description,
+                    "base_currency": symbol.currency_base,
+                    "profit_currency": symbol.currency_profit,
+                    "trade_contract_size": symbol.trade_contract_size,
+                    "minimum_volume": symbol.volume_min,
+                    "maximum_volume": symbol.volume_max,
+                    "volume_step": symbol.volume_step,
+                    "category": "Crypto" if "BTC" in symbol.name or "ETH" in symbol.name
+                               else "Metals" if "GOLD" in symbol.name or "SILVER" in symbol.name
+                               else "Forex" if "USD" in symbol.name or "EUR" in symbol.name
+                               else "Other",
+                    "current_price": tick.ask,  # Current asking price
+                    "minimum_amount_usd": round(min_amount, 2),  # Minimum amount in USD
+                    "amount_step_usd": round(amount_step, 2),  # Amount step in USD
+                    "bid": tick.bid,  # Bid price
+                    "ask": tick.ask,  # Ask price
+                    "spread": round(tick.ask - tick.bid, symbol.digits)  # Current spread
+                }
+                catalogue.append((f"{symbol.name} {symbol.description}".casefold(), symbol_info))
+
+            return catalogue
+
+        catalogue = await self.base_service.call(build)
+        if catalogue is None:
             raise ValueError("Failed to get symbols from MT5")
+        return catalogue
 
-        result = []
-        for symbol in symbols:
-            # Get current price info
-            tick = mt5.symbol_info_tick(symbol.name)
-            if tick is None:
-                continue
-
-            # Calculate minimum amount in USD
-            min_amount = symbol.volume_min * symbol.trade_contract_size * tick.ask
-            amount_step = symbol.volume_step * symbol.trade_contract_size * tick.ask
-
-            symbol_info = {
-                "name": symbol.name,
-                "description": symbol.description,
-                "base_currency": symbol.currency_base,
-                "profit_currency": symbol.currency_profit,
-                "trade_contract_size": symbol.trade_contract_size,
-                "minimum_volume": symbol.volume_min,
-                "maximum_volume": symbol.volume_max,
-                "volume_step": symbol.volume_step,
-                "category": "Crypto" if "BTC" in symbol.name or "ETH" in symbol.name 
-                           else "Metals" if "GOLD" in symbol.name or "SILVER" in symbol.name
-                           else "Forex" if "USD" in symbol.name or "EUR" in symbol.name
-                           else "Other",
-                "current_price": tick.ask,  # Current asking price
-                "minimum_amount_usd": round(min_amount, 2),  # Minimum amount in USD
-                "amount_step_usd": round(amount_step, 2),  # Amount step in USD
-                "bid": tick.bid,  # Bid price
-                "ask": tick.ask,  # Ask price
-                "spread": round(tick.ask - tick.bid, symbol.digits)  # Current spread
-            }
-            
-            # Filter by search query if provided
-            if query:
-                search_term = query.upper()
-                if (search_term in symbol.name.upper() or 
-                    search_term in symbol.description.upper()):
-                    result.append(symbol_info)
-            else:
-                result.append(symbol_info)
-
-        return result
\ No newline at end of file
+    @ttl_cache(ttl=5.0)
+    async def search_symbols(self, query: str = None) -> List[Dict]:
+        """
+        Search and get available trading symbols with pricing information
+
+        Note: Results are cached per query for a few seconds; the symbol
+        catalogue barely changes intraday while dashboards poll it hard
+        """
+        catalogue = await self._get_symbol_catalogue()
+        if not query:
+            return [info for _, info in catalogue]
+        search_term = query.casefold()
+        return [info for searchable, info in catalogue if search_term in searchable]
\ No newline at end of file
@@ -5,6 +5,7 @@ from decimal import Decimal
 from datetime import datetime
 import asyncio
 from .mt5_base_service import MT5BaseService
+from ..utils.background import fire
 from ..models.notification import (
     NotificationChannel, NotificationPriority, AlertType,
     PriceAlert, PnLAlert, SignalAlert, NewsAlert, NotificationConfig
@@ -13,13 +14,134 @@ from ..models.notification import (
 logger = logging.getLogger(__name__)
 
 class MT5NotificationService:
+    # Telegram's sendMessage rejects text over 4096 characters; keep
+    # headroom so a packed batch never trips the limit
+    MAX_BATCH_CHARS = 3800
+
     def __init__(self, base_service: MT5BaseService):
         self.base_service = base_service
         self.config: NotificationConfig = None
         self.price_alerts: List[PriceAlert] = []
         self.pnl_alerts: List[PnLAlert] = []
         self.news_alerts: List[NewsAlert] = []
-        
+        # Coalescing queue: bursty handlers enqueue here and a worker
+        # batches messages into one Telegram call per drain window
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker_task: Optional[asyncio.Task] = None
+        # One long-lived HTTP session shared by all sends; created lazily
+        # so no event loop is needed at construction time
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, creating it on first use.
+
+        Reusing one session keeps pooled connections to api.telegram.org
+        warm, so each notification skips the DNS lookup and TLS handshake
+        a per-call session would pay.
+        """
+        if self._session is None or self._session.closed:
+            # A long keepalive_timeout stops aiohttp from dropping the warm
+            # Telegram connection between notification bursts (its 15s
+            # default closes it long before the next trade), and the
+            # connection limit caps sockets if many alerts fan out at once
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50, keepalive_timeout=300)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session (called from app lifespan)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def enqueue(self, message: str):
+        """
+        Queue a message for batched Telegram delivery.
+
+        Non-async on purpose so handlers can hand off a message without
+        awaiting anything; the batch worker coalesces messages arriving
+        within a short window into a single sendMessage call, which keeps
+        bulk SL/TP updates from firing N sequential HTTPS requests.
+        """
+        self._queue.put_nowait(message)
+
+    def start_worker(self):
+        """Start the batch delivery worker (called from app lifespan)."""
+        if self._worker_task is None or self._worker_task.done():
+            self._worker_task = asyncio.create_task(self._batch_worker())
+
+    async def stop_worker(self):
+        """Stop the batch delivery worker, flushing nothing extra."""
+        if self._worker_task is not None:
+            self._worker_task.cancel()
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+            self._worker_task = None
+
+    def _pack_messages(self, batch: List[str]) -> List[str]:
+        """
+        Join queued messages with separators into as few bodies as fit.
+
+        Splits whenever adding the next message would push the combined
+        body past MAX_BATCH_CHARS, so a close-all burst becomes a handful
+        of accepted sends instead of one 400-rejected mega-message.
+        """
+        sep = "\n\n---\n\n"
+        packed = []
+        current: List[str] = []
+        length = 0
+        for msg in batch:
+            extra = len(msg) + (len(sep) if current else 0)
+            if current and length + extra > self.MAX_BATCH_CHARS:
+                packed.append(sep.join(current))
+                current = [msg]
+                length = len(msg)
+            else:
+                current.append(msg)
+                length += extra
+        if current:
+            packed.append(sep.join(current))
+        return packed
+
+    async def _batch_worker(self):
+        """
+        Drain the queue in ~200ms windows and send combined messages.
+
+        Blocks on the first message, then keeps collecting until the
+        window closes or the batch is full, so quiet periods cost nothing
+        and bursts collapse into a few Telegram round trips, each under
+        Telegram's message length limit.
+        """
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                while len(batch) < 20:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=0.2))
+            except asyncio.TimeoutError:
+                pass
+            for message in self._pack_messages(batch):
+                if not await self.send_telegram(message):
+                    # Trade notifications must not vanish silently when
+                    # Telegram rejects or the send errors out
+                    logger.error(
+                        "Failed to deliver batched Telegram notification "
+                        "(%d characters)", len(message)
+                    )
+
+    def notify_telegram(self, message: str, priority: NotificationPriority = NotificationPriority.MEDIUM):
+        """
+        Schedule a Telegram send without blocking the caller.
+
+        Trade handlers should not wait out the 100-500ms messenger
+        round-trip after the order is already placed; the send runs as a
+        background task and failures are logged by send_telegram itself.
+        """
+        fire(self.send_telegram(message, priority))
+
     async def initialize(self, config: NotificationConfig):
         """Initialize notification service with config"""
         self.config = config
@@ -32,13 +154,14 @@ class MT5NotificationService:
             
         try:
             url = f"https://api.telegram.org/bot{self.config.telegram_token}/sendMessage"
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json={
-                    "chat_id": self.config.telegram_chat_id,
-                    "text": message,
-                    "parse_mode": "HTML"
-                }) as response:
-                    return response.status == 200
+            async with self._get_session().post(url, json={
+                "chat_id": self.config.telegram_chat_id,
+                "text": message,
+                "parse_mode": "HTML"
+            }) as response:
+                if response.status != 200:
+                    logger.error(f"Telegram API returned status {response.status}")
+                return response.status == 200
         except Exception as e:
             logger.error(f"Telegram notification error: {str(e)}")
             return False
@@ -50,11 +173,10 @@ class MT5NotificationService:
             return False
             
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.config.discord_webhook, json={
-                    "content": message
-                }) as response:
-                    return response.status == 204
+            async with self._get_session().post(self.config.discord_webhook, json={
+                "content": message
+            }) as response:
+                return response.status == 204
         except Exception as e:
             logger.error(f"Discord notification error: {str(e)}")
             return False
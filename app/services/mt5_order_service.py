@@ -1,5 +1,4 @@
 from typing import Any, Dict, List, Optional
-from decimal import Decimal
 import MetaTrader5 as mt5
 import logging
 from .mt5_base_service import MT5BaseService
@@ -23,7 +22,7 @@ class MT5OrderService:
         """
         self.base_service = base_service
 
-    def _prepare_trade_request(self, trade_request: TradeRequest) -> Dict[str, Any]:
+    async def _prepare_trade_request(self, trade_request: TradeRequest) -> Dict[str, Any]:
         """
         Prepare pending order request parameters for MT5 API.
         
@@ -38,7 +37,7 @@ class MT5OrderService:
         
         Note: Differs from market order preparation by using TRADE_ACTION_PENDING
         """
-        tick = mt5.symbol_info_tick(trade_request.symbol)
+        tick = await self.base_service.call(mt5.symbol_info_tick, trade_request.symbol)
         if tick is None:
             raise ValueError(f"Cannot get symbol info for {trade_request.symbol}")
             
@@ -84,16 +83,16 @@ class MT5OrderService:
         if not await self.base_service.ensure_connected():
             return []
         try:
-            orders = mt5.orders_get()
+            orders = await self.base_service.call(mt5.orders_get)
             return [
                 PendingOrder(
                     ticket=order.ticket,
                     symbol=order.symbol,
                     type=order.type,
-                    volume=Decimal(str(order.volume_current)),
-                    price=Decimal(str(order.price_open)),
-                    stop_loss=Decimal(str(order.sl)) if order.sl else None,
-                    take_profit=Decimal(str(order.tp)) if order.tp else None,
+                    volume=order.volume_current,
+                    price=order.price_open,
+                    stop_loss=order.sl if order.sl else None,
+                    take_profit=order.tp if order.tp else None,
                     comment=order.comment
                 ) for order in orders
             ] if orders else []
@@ -123,9 +122,9 @@ class MT5OrderService:
         if not await self.base_service.ensure_connected():
             return TradeResponse(order_id=0, status="error", message="Not connected to MT5")
         try:
-            request = self._prepare_trade_request(order)
+            request = await self._prepare_trade_request(order)
             request["action"] = mt5.TRADE_ACTION_PENDING
-            result = mt5.order_send(request)
+            result = await self.base_service.call(mt5.order_send, request)
             
             if result.retcode != mt5.TRADE_RETCODE_DONE:
                 return TradeResponse(
@@ -165,7 +164,7 @@ class MT5OrderService:
                 "action": mt5.TRADE_ACTION_REMOVE,
                 "order": ticket,
             }
-            result = mt5.order_send(request)
+            result = await self.base_service.call(mt5.order_send, request)
             if result.retcode != mt5.TRADE_RETCODE_DONE:
                 return TradeResponse(
                     order_id=0,
@@ -8,6 +8,7 @@ from ..models.trade import Position, TradeResponse, ModifyPositionRequest, Order
 import asyncio
 from tenacity import retry, stop_after_attempt, wait_exponential
 from ..utils.retry_helper import handle_retry_error
+from ..utils.ttl_cache import ttl_cache
 from ..utils.constants import (
     MAX_RETRIES, VERIFICATION_WAIT_TIME, 
     TRADE_DEVIATION, TRADE_MAGIC,
@@ -33,10 +34,15 @@ class MT5PositionService:
         self.base_service = base_service
         self.max_retries = MAX_RETRIES
         
+    @ttl_cache(ttl=1.0)
     async def get_positions(self) -> List[Position]:
         """
         Get all currently open positions.
-        
+
+        Note: Cached for one second so N dashboards polling at 1Hz cost
+        one MT5 query per TTL window; write paths (close/modify/hedge)
+        clear the cache so their follow-up reads see fresh state.
+
         Returns:
         - List[Position]: List of open positions with details:
             - Ticket number
@@ -55,7 +61,7 @@ class MT5PositionService:
             return []
             
         try:
-            positions = mt5.positions_get()
+            positions = await self.base_service.call_shared(mt5.positions_get)
             if positions is None:
                 return []
                 
@@ -65,11 +71,11 @@ class MT5PositionService:
                     ticket=pos.ticket,
                     symbol=pos.symbol,
                     order_type=OrderType.BUY if pos.type == mt5.ORDER_TYPE_BUY else OrderType.SELL,
-                    volume=Decimal(str(pos.volume)),
-                    open_price=Decimal(str(pos.price_open)),
-                    stop_loss=Decimal(str(pos.sl)) if pos.sl else None,
-                    take_profit=Decimal(str(pos.tp)) if pos.tp else None,
-                    profit=Decimal(str(pos.profit)),
+                    volume=pos.volume,
+                    open_price=pos.price_open,
+                    stop_loss=pos.sl if pos.sl else None,
+                    take_profit=pos.tp if pos.tp else None,
+                    profit=pos.profit,
                     open_time=datetime.fromtimestamp(pos.time)
                 ))
             return result
@@ -97,7 +103,7 @@ class MT5PositionService:
         if not await self.base_service.ensure_connected():
             return TradeResponse(order_id=ticket, symbol=None, status="error", message="Not connected to MT5")
         try:
-            position = mt5.positions_get(ticket=ticket)
+            position = await self.base_service.call(mt5.positions_get, ticket=ticket)
             if not position:
                 return TradeResponse(
                     order_id=ticket,
@@ -105,7 +111,7 @@ class MT5PositionService:
                     status="error",
                     message=f"Position {ticket} not found"
                 )
-            
+
             position = position[0]
             request = {
                 "action": mt5.TRADE_ACTION_SLTP,
@@ -114,8 +120,8 @@ class MT5PositionService:
                 "sl": float(modify_request.stop_loss) if modify_request.stop_loss else position.sl,
                 "tp": float(modify_request.take_profit) if modify_request.take_profit else position.tp
             }
-            
-            result = mt5.order_send(request)
+
+            result = await self.base_service.call(mt5.order_send, request)
             if result.retcode != mt5.TRADE_RETCODE_DONE:
                 return TradeResponse(
                     order_id=ticket,
@@ -134,6 +140,7 @@ class MT5PositionService:
                     message="Position modification verification failed"
                 )
             
+            self.get_positions.cache_clear()
             return TradeResponse(
                 order_id=ticket,
                 symbol=position.symbol,
@@ -171,7 +178,7 @@ class MT5PositionService:
             )
             
         try:
-            position = mt5.positions_get(ticket=ticket)
+            position = await self.base_service.call(mt5.positions_get, ticket=ticket)
             if not position:
                 return TradeResponse(
                     order_id=ticket,
@@ -179,23 +186,24 @@ class MT5PositionService:
                     status="error",
                     message=f"Position {ticket} not found"
                 )
-                
+
             position = position[0]
+            tick = await self.base_service.call(mt5.symbol_info_tick, position.symbol)
             request = {
                 "action": mt5.TRADE_ACTION_DEAL,
                 "position": ticket,
                 "symbol": position.symbol,
                 "volume": float(position.volume),
                 "type": mt5.ORDER_TYPE_SELL if position.type == mt5.ORDER_TYPE_BUY else mt5.ORDER_TYPE_BUY,
-                "price": mt5.symbol_info_tick(position.symbol).bid if position.type == mt5.ORDER_TYPE_BUY else mt5.symbol_info_tick(position.symbol).ask,
+                "price": tick.bid if position.type == mt5.ORDER_TYPE_BUY else tick.ask,
                 "deviation": TRADE_DEVIATION,
                 "magic": TRADE_MAGIC,
                 "comment": "python script close",
                 "type_time": mt5.ORDER_TIME_GTC,
                 "type_filling": mt5.ORDER_FILLING_IOC,
             }
-            
-            result = mt5.order_send(request)
+
+            result = await self.base_service.call(mt5.order_send, request)
             if result.retcode != mt5.TRADE_RETCODE_DONE:
                 return TradeResponse(
                     order_id=ticket,
@@ -214,6 +222,7 @@ class MT5PositionService:
                     message="Position closure verification failed"
                 )
                 
+            self.get_positions.cache_clear()
             return TradeResponse(
                 order_id=result.order,
                 symbol=position.symbol,
@@ -247,15 +256,56 @@ class MT5PositionService:
             return []
         try:
             positions = await self.get_positions()
-            results = []
-            for position in positions:
-                result = await self.close_position(position.ticket)
-                results.append(result)
-            return results
+            # Fan out all closures at once: the MT5 calls still serialize
+            # on the terminal worker thread, but retries, verification
+            # sleeps and notification bookkeeping overlap instead of
+            # running back to back per position
+            results = await asyncio.gather(
+                *(self.close_position(position.ticket) for position in positions),
+                return_exceptions=True
+            )
+            return [
+                result if not isinstance(result, BaseException) else TradeResponse(
+                    order_id=position.ticket,
+                    status="error",
+                    message=f"Failed to close position: {result}",
+                    symbol=position.symbol
+                )
+                for position, result in zip(positions, results)
+            ]
         except Exception as e:
             logger.error(f"Error closing all positions: {str(e)}")
             return []
 
+    async def close_all_stream(self):
+        """
+        Close all open positions, yielding each result as it completes.
+
+        Yields:
+        - TradeResponse per position, in completion order
+
+        Note: Lets callers stream progress row by row instead of waiting
+        for the slowest closure; exceptions are normalized to error
+        responses so the stream never breaks mid-way
+        """
+        if not await self.base_service.ensure_connected():
+            return
+        positions = await self.get_positions()
+
+        async def close_safe(position):
+            try:
+                return await self.close_position(position.ticket)
+            except Exception as e:
+                return TradeResponse(
+                    order_id=position.ticket,
+                    status="error",
+                    message=f"Failed to close position: {e}",
+                    symbol=position.symbol
+                )
+
+        for completed in asyncio.as_completed([close_safe(p) for p in positions]):
+            yield await completed
+
     async def create_hedge_position(self, ticket: int) -> TradeResponse:
         """
         Create a hedging position against an existing position.
@@ -274,7 +324,7 @@ class MT5PositionService:
         if not await self.base_service.ensure_connected():
             return TradeResponse(order_id=ticket, symbol=None, status="error", message="Not connected to MT5")
         try:
-            position = mt5.positions_get(ticket=ticket)
+            position = await self.base_service.call(mt5.positions_get, ticket=ticket)
             if not position:
                 return TradeResponse(
                     order_id=ticket,
@@ -282,14 +332,15 @@ class MT5PositionService:
                     status="error",
                     message=f"Position {ticket} not found"
                 )
-            
+
             position = position[0]
+            tick = await self.base_service.call(mt5.symbol_info_tick, position.symbol)
             request = {
                 "action": mt5.TRADE_ACTION_DEAL,
                 "symbol": position.symbol,
                 "volume": float(position.volume),
                 "type": mt5.ORDER_TYPE_SELL if position.type == mt5.ORDER_TYPE_BUY else mt5.ORDER_TYPE_BUY,
-                "price": mt5.symbol_info_tick(position.symbol).ask if position.type == mt5.ORDER_TYPE_BUY else mt5.symbol_info_tick(position.symbol).bid,
+                "price": tick.ask if position.type == mt5.ORDER_TYPE_BUY else tick.bid,
                 "deviation": TRADE_DEVIATION,
                 "magic": TRADE_MAGIC,
                 "comment": "python script hedge",
@@ -297,7 +348,7 @@ class MT5PositionService:
                 "type_filling": mt5.ORDER_FILLING_IOC,
             }
             
-            result = mt5.order_send(request)
+            result = await self.base_service.call(mt5.order_send, request)
             if result.retcode != mt5.TRADE_RETCODE_DONE:
                 return TradeResponse(
                     order_id=ticket,
@@ -306,6 +357,7 @@ class MT5PositionService:
                     message=f"Failed to create hedge position: {result.comment}"
                 )
             
+            self.get_positions.cache_clear()
             return TradeResponse(
                 order_id=result.order,
                 symbol=position.symbol,
@@ -323,7 +375,7 @@ class MT5PositionService:
         """
         try:
             await asyncio.sleep(VERIFICATION_WAIT_TIME)
-            position = mt5.positions_get(ticket=ticket)
+            position = await self.base_service.call(mt5.positions_get, ticket=ticket)
             if position:
                 logger.error(f"Position {ticket} still exists after closure attempt")
                 return False
@@ -338,7 +390,7 @@ class MT5PositionService:
         """
         try:
             await asyncio.sleep(VERIFICATION_WAIT_TIME)
-            position = mt5.positions_get(ticket=ticket)
+            position = await self.base_service.call(mt5.positions_get, ticket=ticket)
             if not position:
                 logger.error(f"Cannot find position with ticket {ticket}")
                 return False
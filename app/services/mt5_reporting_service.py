@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
@@ -147,14 +148,15 @@ class MT5ReportingService:
             account_info = await self.base_service.get_account_info()
             trades = await self.base_service.get_trades_history(start_date, end_date)
             
-            # Get top performing pairs
+            # Get top performing pairs; analyze all symbols concurrently.
+            # TaskGroup cancels the remaining analyses if one fails, so a
+            # broken symbol does not leave orphaned MT5 queries running.
             symbols = await self.base_service.get_traded_symbols()
-            pair_analyses = []
-            for symbol in symbols:
-                analysis = await self.analyze_pair(symbol)
-                pair_analyses.append(analysis)
-            
-            top_pairs = sorted(pair_analyses, 
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(self.analyze_pair(symbol)) for symbol in symbols]
+            pair_analyses = [task.result() for task in tasks]
+
+            top_pairs = sorted(pair_analyses,
                              key=lambda x: x.total_profit, 
                              reverse=True)[:5]
 
@@ -69,7 +69,7 @@ class MT5TradingService:
             trade_request.calculated_volume = volume
             
             # Prepare trade request with calculated volume
-            tick = mt5.symbol_info_tick(trade_request.symbol)
+            tick = await self.base_service.call(mt5.symbol_info_tick, trade_request.symbol)
             if tick is None:
                 raise ValueError(f"Cannot get symbol info for {trade_request.symbol}")
                 
@@ -94,7 +94,7 @@ class MT5TradingService:
                 request["tp"] = float(trade_request.take_profit)
 
             # Execute the trade
-            result = mt5.order_send(request)
+            result = await self.base_service.call(mt5.order_send, request)
             
             if result.retcode != mt5.TRADE_RETCODE_DONE:
                 logger.error(f"Order failed: {result.comment}")
@@ -137,7 +137,7 @@ class MT5TradingService:
         try:
             await asyncio.sleep(VERIFICATION_WAIT_TIME)
             
-            position = mt5.positions_get(ticket=result.order)
+            position = await self.base_service.call(mt5.positions_get, ticket=result.order)
             if not position:
                 logger.error(f"Cannot find position with ticket {result.order}")
                 return False
@@ -180,10 +180,10 @@ class MT5TradingService:
         Raises:
             ValueError: If symbol not found
         """
-        symbol_info = mt5.symbol_info(symbol)
+        symbol_info = await self.base_service.call(mt5.symbol_info, symbol)
         if symbol_info is None:
             raise ValueError(f"Symbol {symbol} not found")
-            
+
         min_volume = symbol_info.volume_min
         contract_size = symbol_info.trade_contract_size
         current_price = symbol_info.ask
@@ -205,10 +205,10 @@ class MT5TradingService:
         Raises:
             ValueError: If symbol not found or amount is outside allowed limits
         """
-        symbol_info = mt5.symbol_info(symbol)
+        symbol_info = await self.base_service.call(mt5.symbol_info, symbol)
         if symbol_info is None:
             raise ValueError(f"Symbol {symbol} not found")
-            
+
         current_price = symbol_info.ask
         contract_size = symbol_info.trade_contract_size
         
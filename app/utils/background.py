@@ -0,0 +1,31 @@
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Strong references keep fired tasks alive until they finish; asyncio only
+# holds weak references to running tasks
+_pending: set = set()
+
+
+def _log_exception(task: asyncio.Task) -> None:
+    _pending.discard(task)
+    if not task.cancelled():
+        exc = task.exception()
+        if exc is not None:
+            logger.error(f"Background task failed: {exc}")
+
+
+def fire(coro) -> asyncio.Task:
+    """
+    Run a coroutine in the background without blocking the caller.
+
+    Used to take side effects like Telegram notifications off the
+    request path: the HTTP response returns as soon as the trading call
+    completes while the outbound I/O runs concurrently on the event
+    loop. Exceptions are logged instead of silently dropped.
+    """
+    task = asyncio.create_task(coro)
+    _pending.add(task)
+    task.add_done_callback(_log_exception)
+    return task
@@ -24,6 +24,8 @@ timeframe_display = {
     TimeFrame.Y1: "1 year"
 }
 
-def get_timeframe_display(timeframe: TimeFrame) -> str:
-    """Convert TimeFrame enum to human readable string"""
-    return timeframe_display.get(timeframe, str(timeframe)) 
\ No newline at end of file
+# Every member gets an entry (str(tf) fallback precomputed), so the hot
+# path is a bound dict .get with no Python-level function body to run
+TIMEFRAME_DISPLAY = {tf: timeframe_display.get(tf, str(tf)) for tf in TimeFrame}
+
+get_timeframe_display = TIMEFRAME_DISPLAY.get
\ No newline at end of file
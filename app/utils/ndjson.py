@@ -0,0 +1,39 @@
+import msgspec
+
+# Reused across requests; encoding plain dicts with msgspec avoids both
+# pydantic models and per-row encoder setup on the streaming hot path
+_ENCODER = msgspec.json.Encoder()
+
+# Lines accumulated per network chunk. One ASGI send per row costs more
+# event-loop scheduling than the serialization itself on large histories;
+# batching keeps time-to-first-byte low while cutting sends ~1000x.
+BATCH_SIZE = 1000
+
+
+async def encode_batches(rows, batch: int = BATCH_SIZE):
+    """
+    Encode an async iterator of dicts as NDJSON, yielding multi-line chunks.
+
+    Rows are serialized as they arrive, so peak memory stays bounded by
+    the batch size rather than the full result set.
+
+    Parameters:
+    - rows: Async iterator of JSON-serializable dicts
+    - batch: Number of lines per yielded bytes chunk
+
+    Yields:
+    - bytes containing up to `batch` newline-terminated JSON rows
+    """
+    encode = _ENCODER.encode
+    buf = bytearray()
+    pending = 0
+    async for row in rows:
+        buf += encode(row)
+        buf += b"\n"
+        pending += 1
+        if pending >= batch:
+            yield bytes(buf)
+            buf.clear()
+            pending = 0
+    if buf:
+        yield bytes(buf)
@@ -0,0 +1,29 @@
+import functools
+
+def cached_router(get_router):
+    """
+    Memoize a get_router factory per service-instance identity.
+
+    Building an APIRouter re-registers every route and makes FastAPI
+    regenerate response schemas; when get_router is called again with the
+    same service objects (tests, hot reload), the existing router is
+    returned instead.
+
+    Args:
+        get_router: Router factory taking one or more service instances
+
+    Returns:
+        Wrapped factory returning a cached APIRouter per argument identity
+    """
+    cache = {}
+
+    @functools.wraps(get_router)
+    def wrapper(*services):
+        key = tuple(id(service) for service in services)
+        router = cache.get(key)
+        if router is None:
+            router = get_router(*services)
+            cache[key] = router
+        return router
+
+    return wrapper
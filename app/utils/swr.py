@@ -0,0 +1,91 @@
+import time
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from .background import fire
+
+logger = logging.getLogger(__name__)
+
+# Keep caches small; entries are short-lived snapshots, not a data store
+MAX_ENTRIES = 128
+
+
+class SWRCache:
+    """
+    Stale-while-revalidate cache for expensive read-mostly calls.
+
+    Entries carry two deadlines: while fresh the cached value is returned
+    directly; while stale it is still returned immediately but a
+    background task refreshes it, so pollers never wait out the recompute;
+    past the stale deadline the recompute happens inline. Keeps heavy MT5
+    history scans off the request path for dashboard polling.
+    """
+
+    def __init__(self, maxsize: int = MAX_ENTRIES):
+        self._entries: Dict[Hashable, Tuple[Any, float, float]] = {}
+        self._refreshing: set = set()
+        self._maxsize = maxsize
+
+    async def get_or_set(
+        self,
+        key: Hashable,
+        producer: Callable[[], Awaitable[Any]],
+        fresh: float,
+        stale: float
+    ) -> Any:
+        """
+        Return the cached value for key, refreshing per the SWR policy.
+
+        Parameters:
+        - key: Hashable cache key (endpoint name plus arguments)
+        - producer: Zero-argument coroutine factory computing the value
+        - fresh: Seconds the value is served without refreshing
+        - stale: Seconds past fresh during which the value is still
+          served while a background refresh runs
+        """
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, fresh_until, stale_until = entry
+            if now < fresh_until:
+                return value
+            if now < stale_until:
+                self._refresh_in_background(key, producer, fresh, stale)
+                return value
+
+        value = await producer()
+        self._store(key, value, fresh, stale)
+        return value
+
+    def _store(self, key: Hashable, value: Any, fresh: float, stale: float):
+        now = time.monotonic()
+        self._entries[key] = (value, now + fresh, now + fresh + stale)
+        # Keys embed client-supplied arguments (symbols, date ranges), so
+        # bound the map; evict whichever entry expires soonest
+        while len(self._entries) > self._maxsize:
+            oldest = min(self._entries, key=lambda k: self._entries[k][2])
+            self._entries.pop(oldest, None)
+
+    def _refresh_in_background(
+        self,
+        key: Hashable,
+        producer: Callable[[], Awaitable[Any]],
+        fresh: float,
+        stale: float
+    ):
+        # Single-flight per key: one refresh task at a time
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+
+        async def refresh():
+            try:
+                self._store(key, await producer(), fresh, stale)
+            except Exception as e:
+                logger.error(f"SWR refresh failed for {key}: {e}")
+            finally:
+                self._refreshing.discard(key)
+
+        # fire() keeps a strong reference until the task completes; a bare
+        # create_task here could be garbage-collected mid-refresh
+        fire(refresh())
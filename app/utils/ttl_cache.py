@@ -0,0 +1,58 @@
+import time
+import functools
+import asyncio
+
+# Keep caches small; entries are short-lived snapshots, not a data store
+MAX_ENTRIES = 128
+
+def ttl_cache(ttl: float, maxsize: int = MAX_ENTRIES):
+    """
+    Cache results of an async method for a short time window.
+
+    Frontend pollers and load-balancer probes hit the same read endpoints
+    many times per second; within `ttl` seconds all callers with the same
+    arguments share one cached result instead of a fresh MT5 round-trip.
+
+    Args:
+        ttl: Seconds a cached value stays fresh
+        maxsize: Maximum number of cached keys (oldest evicted first)
+
+    Note: Cache keys include `self`, so each service instance has its own
+    entries. The wrapped function gains a `cache_clear()` helper for
+    invalidation after state-changing operations.
+    """
+    def decorator(func):
+        cache = {}
+        locks = {}
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            entry = cache.get(key)
+            now = time.monotonic()
+            if entry is not None and now - entry[0] < ttl:
+                return entry[1]
+
+            # Per-key lock so a burst of cold callers results in one call
+            lock = locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                entry = cache.get(key)
+                now = time.monotonic()
+                if entry is not None and now - entry[0] < ttl:
+                    return entry[1]
+
+                result = await func(*args, **kwargs)
+                cache[key] = (now, result)
+                while len(cache) > maxsize:
+                    oldest = min(cache, key=lambda k: cache[k][0])
+                    cache.pop(oldest, None)
+                    locks.pop(oldest, None)
+                return result
+
+        def cache_clear():
+            cache.clear()
+            locks.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator